@@ -4,7 +4,6 @@
 Revamp flow: upload → parse → AI enhance → render → deliver.
 Owns all revamp-specific business logic; conversation_router and webhook delegate here.
 """
-import asyncio
 from pathlib import Path
 from loguru import logger
 from sqlalchemy.orm import Session
@@ -85,10 +84,7 @@ async def handle_revamp_step(db: Session, job: Job, text: str) -> str:
                 logger.info(f"[revamp] Rendering revamped PDF for job.id={job.id}")
                 from app.services import pdf_renderer
                 from app.utils import generate_filename
-                loop = asyncio.get_event_loop()
-                pdf_bytes = await loop.run_in_executor(
-                    None, pdf_renderer.render_pdf_from_data, answers, "template_1", "revamp"
-                )
+                pdf_bytes = await pdf_renderer.render_pdf_from_data_async(answers, "template_1", "revamp")
                 filename = generate_filename(job)
                 job.draft_text = await storage.save_document(job.id, pdf_bytes, filename)
                 job.status = "preview_ready"
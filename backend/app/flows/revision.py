@@ -119,7 +119,7 @@ def start_revision(db: Session, job: Job, telegram_id: str) -> str:
     )
 
 
-def handle_revision_step(db: Session, job: Job, message_text: str, telegram_id: str) -> str:
+async def handle_revision_step(db: Session, job: Job, message_text: str, telegram_id: str) -> str:
     """Route revision flow based on _revision_step. Returns message to send."""
     answers = job.answers or {}
     if not isinstance(answers, dict):
@@ -132,7 +132,7 @@ def handle_revision_step(db: Session, job: Job, message_text: str, telegram_id:
         section_key = revision_step.replace("collecting_", "")
         return _handle_section_collection(db, job, section_key, message_text)
     if revision_step == "confirm":
-        return _handle_revision_confirmation(db, job, message_text, telegram_id)
+        return await _handle_revision_confirmation(db, job, message_text, telegram_id)
 
     return "Something went wrong. Type /revise to try again."
 
@@ -237,7 +237,7 @@ def _show_revision_confirmation(db: Session, job: Job, section_key: str) -> str:
     )
 
 
-def _handle_revision_confirmation(db: Session, job: Job, message_text: str, telegram_id: str) -> str:
+async def _handle_revision_confirmation(db: Session, job: Job, message_text: str, telegram_id: str) -> str:
     text = (message_text or "").strip().lower()
 
     if text == "back":
@@ -271,7 +271,7 @@ def _handle_revision_confirmation(db: Session, job: Job, message_text: str, tele
     try:
         answers = job.answers or {}
         template = answers.get("template", "template_1")
-        pdf_bytes = pdf_renderer.render_pdf_from_data(answers, template, job.type)
+        pdf_bytes = await pdf_renderer.render_pdf_from_data_async(answers, template, job.type)
         filename = _generate_filename(job)
         job.draft_text = await storage.save_document(job.id, pdf_bytes, filename)
         db.commit()
@@ -126,9 +126,13 @@ async def startup_event():
 
 @app.on_event("shutdown")
 def shutdown_event():
-    """Stop scheduler on shutdown."""
+    """Stop scheduler and document render workers on shutdown."""
     from app.services.scheduler import stop_scheduler
+    from app.services.pdf_renderer import shutdown_pdf_pool
+    from app.services.renderer import shutdown_docx_pool
     stop_scheduler()
+    shutdown_pdf_pool()
+    shutdown_docx_pool()
 
 
 @app.get("/health/db")
@@ -413,9 +413,7 @@ async def send_pdf_to_user(chat_id: int | str, user_id: str, db: Session):
             
             # All templates now have direct PDF generation
             try:
-                pdf_bytes = await asyncio.get_event_loop().run_in_executor(
-                    None, pdf_renderer.render_pdf_from_data, latest_job.answers, template
-                )
+                pdf_bytes = await pdf_renderer.render_pdf_from_data_async(latest_job.answers, template)
                 # Generate filename
                 doc_type = latest_job.type or 'document'
                 from datetime import datetime
@@ -3,7 +3,6 @@ CareerBuddy - Conversation Router
 Author: Sir Dave
 """
 from __future__ import annotations
-import asyncio
 from datetime import datetime, timedelta, timezone
 from loguru import logger
 from sqlalchemy.orm import Session
@@ -678,10 +677,7 @@ async def handle_resume(db: Session, job: Job, text: str) -> str:
         try:
             logger.info(f"[handle_resume] Generating PDF for job.id={job.id}")
             template = answers.get("template", "template_1")
-            loop = asyncio.get_event_loop()
-            pdf_bytes = await loop.run_in_executor(
-                None, pdf_renderer.render_pdf_from_data, answers, template, job.type
-            )
+            pdf_bytes = await pdf_renderer.render_pdf_from_data_async(answers, template, job.type)
             filename = _generate_filename(job)
             job.draft_text = await storage.save_document(job.id, pdf_bytes, filename)
             job.status = "preview_ready"
@@ -820,10 +816,7 @@ async def handle_cover(db: Session, job: Job, text: str) -> str:
                 return limit_msg
             try:
                 logger.info(f"[cover] Rendering cover letter PDF for job.id={job.id}")
-                loop = asyncio.get_event_loop()
-                pdf_bytes = await loop.run_in_executor(
-                    None, pdf_renderer.render_pdf_from_data, answers, "template_1", "cover"
-                )
+                pdf_bytes = await pdf_renderer.render_pdf_from_data_async(answers, "template_1", "cover")
                 filename = _generate_filename(job)
                 job.draft_text = await storage.save_document(job.id, pdf_bytes, filename)
                 job.status = "preview_ready"
@@ -969,10 +962,7 @@ async def generate_sample_document(db: Session, user_id: int, template_choice: s
     logger.info(f"[generate_sample] Created sample job.id={job.id} with template={template_choice}")
 
     try:
-        loop = asyncio.get_event_loop()
-        pdf_bytes = await loop.run_in_executor(
-            None, pdf_renderer.render_pdf_from_data, sample_data, template_choice, doc_type
-        )
+        pdf_bytes = await pdf_renderer.render_pdf_from_data_async(sample_data, template_choice, doc_type)
         filename = _generate_filename(job)
         job.draft_text = await storage.save_document(job.id, pdf_bytes, filename)
         job.status = "completed"
@@ -1242,7 +1232,7 @@ async def handle_inbound(db: Session, telegram_user_id: str, text: str, msg_id:
     revising_job = _active_revising_job(db, user.id)
     if revising_job:
         from app.flows import revision
-        return revision.handle_revision_step(db, revising_job, incoming, telegram_user_id)
+        return await revision.handle_revision_step(db, revising_job, incoming, telegram_user_id)
 
     # 1.9.6) /revise command
     if t_lower in REVISE_COMMANDS:
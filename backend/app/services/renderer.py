@@ -5,25 +5,119 @@ CareerBuddy - Document Renderer (DOCX)
 Document rendering service - Generate professional DOCX and PDF files
 Author: Sir Dave
 """
+from __future__ import annotations
+
+import multiprocessing
+import os
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from copy import deepcopy
+from datetime import date
+from functools import lru_cache
+from itertools import zip_longest
 from io import BytesIO
-from typing import Dict, List
+from typing import TYPE_CHECKING, Dict, List
+from xml.sax.saxutils import escape as _xml_escape
 from docx import Document
-from docx.shared import Pt, Inches, RGBColor
+from docx.shared import Pt, Inches
 from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.enum.table import WD_ALIGN_VERTICAL
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
+from docx.table import Table, _Cell
+from docx.text.run import Run
 from loguru import logger
 
-from app.models import Job
+# Annotations only: batch workers import this module and should not set up
+# the database layer that app.models pulls in.
+if TYPE_CHECKING:
+    from app.models import Job
 
 
 def _clean_skills(skills_list):
     """Remove invalid skills (numbers, empty strings) from old data."""
     if not skills_list:
         return []
-    return [s.strip() for s in skills_list if s and isinstance(s, str) and not s.strip().isdigit() and len(s.strip()) > 1]
+    return [s2 for s in skills_list if isinstance(s, str) and len(s2 := s.strip()) > 1 and not s2.isdigit()]
 
 
-def _add_hyperlink(paragraph, url, text):
+@lru_cache(maxsize=None)
+def _skeleton_docx(margin: float) -> bytes:
+    """Empty document with `margin` inches on every side, built once per margin."""
+    doc = Document()
+    for section in doc.sections:
+        section.top_margin = Inches(margin)
+        section.bottom_margin = Inches(margin)
+        section.left_margin = Inches(margin)
+        section.right_margin = Inches(margin)
+    buffer = BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+def _new_document(margin: float) -> Document:
+    """
+    Fresh Document cloned from the cached skeleton. Loading the saved bytes is
+    cheaper than Document() plus the margin setup, which reads the default
+    template from disk on every call.
+    """
+    return Document(BytesIO(_skeleton_docx(margin)))
+
+
+_W_NSDECLS = nsdecls('w')
+_HYPERLINK_NSDECLS = nsdecls('w', 'r')
+_SPECIAL_CHARS = re.compile(r'([\t\r\n])')
+_SPECIAL_CHAR_XML = {'\t': '<w:tab/>', '\r': '<w:br/>', '\n': '<w:br/>'}
+
+
+def _text_xml(text) -> str:
+    """
+    Run content markup for `text`, as Run.text writes it: <w:t> chunks, with
+    each tab as <w:tab/> and each line break as <w:br/>.
+    """
+    if not text:
+        return ''
+    if '\t' in text or '\r' in text or '\n' in text:
+        return ''.join(_SPECIAL_CHAR_XML.get(piece) or _text_xml(piece)
+                       for piece in _SPECIAL_CHARS.split(text))
+    space = ' xml:space="preserve"' if text != text.strip() else ''
+    return f'<w:t{space}>{_xml_escape(text)}</w:t>'
+
+
+@lru_cache(maxsize=None)
+def _rpr(font: str, size: float, bold: bool = False, italic: bool = False, color: str | None = None) -> str:
+    """
+    <w:rPr> markup for one run format, in the element order python-docx
+    writes. `size` is in points, `color` a hex RGB string such as '003366'.
+    """
+    return (
+        f'<w:rPr><w:rFonts w:ascii="{font}" w:hAnsi="{font}"/>'
+        + ('<w:b/>' if bold else '')
+        + ('<w:i/>' if italic else '')
+        + (f'<w:color w:val="{color}"/>' if color else '')
+        + f'<w:sz w:val="{round(size * 2)}"/></w:rPr>'
+    )
+
+
+def _add_run(paragraph, text, rpr: str) -> None:
+    """
+    Append a run with formatting `rpr` (from _rpr) to `paragraph`. Same XML
+    as add_run() followed by the font setters, parsed in one call instead of
+    one python-docx property walk per attribute.
+    """
+    paragraph._p.append(parse_xml(f'<w:r {_W_NSDECLS}>{rpr}{_text_xml(text)}</w:r>'))
+
+
+def _add_text_paragraph(container, text, rpr: str):
+    """container.add_paragraph(text) with its run formatted as `rpr`."""
+    paragraph = container.add_paragraph()
+    if text:
+        _add_run(paragraph, text, rpr)
+    return paragraph
+
+
+def _add_hyperlink(paragraph, url, text, font: str | None = None, size: float | None = None):
     """
     Add a hyperlink to a paragraph.
     
@@ -31,43 +125,30 @@ def _add_hyperlink(paragraph, url, text):
         paragraph: docx paragraph object
         url: URL to link to
         text: Display text for the link
+        font: Font name for the link run (inherited if None)
+        size: Font size in points (inherited if None)
     
     Returns:
         The hyperlink run
     """
-    from docx.oxml.shared import OxmlElement
-    from docx.oxml.ns import qn
-    
     # Create the relationship
     part = paragraph.part
     r_id = part.relate_to(url, 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/hyperlink', is_external=True)
     
-    # Create the hyperlink element
-    hyperlink = OxmlElement('w:hyperlink')
-    hyperlink.set(qn('r:id'), r_id)
-    
-    # Create a new run for the hyperlink text
-    new_run = OxmlElement('w:r')
-    rPr = OxmlElement('w:rPr')
-    
-    # Add hyperlink styling (blue, underlined)
-    color = OxmlElement('w:color')
-    color.set(qn('w:val'), '0000FF')
-    rPr.append(color)
-    
-    u = OxmlElement('w:u')
-    u.set(qn('w:val'), 'single')
-    rPr.append(u)
-    
-    new_run.append(rPr)
-    new_run.text = text
-    hyperlink.append(new_run)
+    # Hyperlink with one blue, underlined run, parsed in a single call
+    rfonts = f'<w:rFonts w:ascii="{font}" w:hAnsi="{font}"/>' if font else ''
+    sz = f'<w:sz w:val="{round(size * 2)}"/>' if size else ''
+    hyperlink = parse_xml(
+        f'<w:hyperlink {_HYPERLINK_NSDECLS} r:id="{r_id}">'
+        f'<w:r><w:rPr>{rfonts}<w:color w:val="0000FF"/>{sz}<w:u w:val="single"/></w:rPr>{_text_xml(text)}</w:r>'
+        '</w:hyperlink>'
+    )
+    new_run = hyperlink[0]
     
     # Add hyperlink to paragraph
     paragraph._p.append(hyperlink)
     
     # Return a run object for further styling
-    from docx.text.run import Run
     return Run(new_run, paragraph)
 
 
@@ -76,7 +157,11 @@ def render_resume(job: Job) -> bytes:
     Generate professional DOCX resume with table-based layout.
     Supports multiple templates based on user selection.
     """
-    answers = job.answers or {}
+    return _render_resume_answers(job.answers or {})
+
+
+def _render_resume_answers(answers: dict) -> bytes:
+    """Render resume/CV answers with their selected template."""
     selected_template = answers.get("template", "template_1")
 
     # Route to appropriate template renderer
@@ -89,6 +174,66 @@ def render_resume(job: Job) -> bytes:
         return _render_template_1(answers)
 
 
+# Worker processes for batch renders, started on first use. Spawned rather than
+# forked because the web process already runs threads (executor, scheduler).
+_docx_pool: ProcessPoolExecutor | None = None
+_docx_pool_lock = threading.Lock()
+
+
+def _get_docx_pool() -> ProcessPoolExecutor:
+    global _docx_pool
+    with _docx_pool_lock:
+        if _docx_pool is None:
+            _docx_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count() or 1,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _docx_pool
+
+
+def _discard_docx_pool(pool: ProcessPoolExecutor) -> None:
+    """
+    Forget a pool whose worker died, so the next batch starts a fresh one. A
+    concurrent caller may already have replaced it; only the broken pool is
+    dropped.
+    """
+    global _docx_pool
+    with _docx_pool_lock:
+        if _docx_pool is pool:
+            _docx_pool = None
+    pool.shutdown(wait=False)
+
+
+def shutdown_docx_pool() -> None:
+    """Stop the batch render workers, if any were started."""
+    global _docx_pool
+    with _docx_pool_lock:
+        if _docx_pool is not None:
+            _docx_pool.shutdown(wait=True)
+            _docx_pool = None
+
+
+def render_resumes_from_data(answers_list: List[dict]) -> List[bytes]:
+    """
+    Render several resumes/CVs in parallel, each with its own selected
+    template. python-docx and lxml tree building hold the GIL for most of a
+    render, so the batch is spread over the shared worker pool, one resume per
+    task; results come back in input order. Takes answers dicts rather than
+    Jobs so nothing bound to a DB session crosses the process boundary. If a
+    worker dies the pool is dropped and the batch is rendered inline.
+    """
+    if len(answers_list) <= 1:
+        return [_render_resume_answers(answers) for answers in answers_list]
+
+    pool = _get_docx_pool()
+    try:
+        return list(pool.map(_render_resume_answers, answers_list))
+    except BrokenProcessPool:
+        logger.warning("[renderer] Render worker died; restarting the process pool")
+        _discard_docx_pool(pool)
+        return [_render_resume_answers(answers) for answers in answers_list]
+
+
 def _render_template_1(answers: dict) -> bytes:
     """
     Template 1: Classic Professional Layout
@@ -100,15 +245,8 @@ def _render_template_1(answers: dict) -> bytes:
     - Medium spacing (12pt) between sections
     - 1.25" margins all round
     """
-    doc = Document()
-
-    # Set document margins - 0.5 inches all round (to match reference template)
-    sections = doc.sections
-    for section in sections:
-        section.top_margin = Inches(0.5)
-        section.bottom_margin = Inches(0.5)
-        section.left_margin = Inches(0.5)
-        section.right_margin = Inches(0.5)
+    # Document margins - 0.5 inches all round (to match reference template)
+    doc = _new_document(0.5)
 
     # Get data
     basics = answers.get('basics', {})
@@ -127,18 +265,13 @@ def _render_template_1(answers: dict) -> bytes:
     # Name (Large, Bold, Centered) - Increased font size
     name_para = doc.add_paragraph()
     name_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    name_run = name_para.add_run(name)
-    name_run.font.size = Pt(24)  # Increased from 20pt
-    name_run.font.bold = True
-    name_run.font.name = 'Calibri'
+    _add_run(name_para, name, _rpr('Calibri', 24, bold=True))  # Increased from 20pt
     name_para.space_after = Pt(0)  # Tighter spacing
 
     # Title (Centered, ALL CAPS) - Increased font size
     title_para = doc.add_paragraph()
     title_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    title_run = title_para.add_run(title.upper())  # ALL CAPS
-    title_run.font.size = Pt(14)  # Increased from 12pt
-    title_run.font.name = 'Calibri'
+    _add_run(title_para, title.upper(), _rpr('Calibri', 14))  # ALL CAPS
     title_para.space_after = Pt(0)  # Tighter spacing
 
     # Contact Info - NO ICONS, pipe separators - Calibri 12pt
@@ -153,9 +286,7 @@ def _render_template_1(answers: dict) -> bytes:
     if contact_parts:
         contact_para = doc.add_paragraph()
         contact_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        contact_run = contact_para.add_run(' | '.join(contact_parts))
-        contact_run.font.size = Pt(13)  # Increased from 12pt
-        contact_run.font.name = 'Calibri'
+        _add_run(contact_para, ' | '.join(contact_parts), _rpr('Calibri', 13))  # Increased from 12pt
         contact_para.space_after = Pt(0)  # Tighter spacing
 
     # Add horizontal line after header
@@ -163,398 +294,25 @@ def _render_template_1(answers: dict) -> bytes:
     doc.add_paragraph().space_after = Pt(10)  # Reduced spacing before first section
 
     # ==================== MAIN CONTENT TABLE ====================
-    from docx.oxml.shared import OxmlElement
-    from docx.oxml.ns import qn
-    
-    # Calculate number of rows needed
-    num_rows = 0
-    if profiles: num_rows += 1
-    if summary: num_rows += 1
-    if experiences: num_rows += 1
-    if education: num_rows += 1
-    if projects: num_rows += 1
-    if references: num_rows += 1
-    if skills: num_rows += 1
-    
-    if num_rows == 0:
-        buffer = BytesIO()
-        doc.save(buffer)
-        buffer.seek(0)
-        return buffer.getvalue()
-    
-    table = doc.add_table(rows=num_rows, cols=2)
-    table.style = 'Table Grid'
-    
-    # Remove all table borders (make them invisible)
-    from docx.oxml.shared import OxmlElement
-    from docx.oxml.ns import qn
-    
-    tbl = table._element
-    tblPr = tbl.tblPr
-    if tblPr is None:
-        tblPr = OxmlElement('w:tblPr')
-        tbl.insert(0, tblPr)
-    
-    tblBorders = OxmlElement('w:tblBorders')
-    for border_name in ['top', 'left', 'bottom', 'right', 'insideH', 'insideV']:
-        border = OxmlElement(f'w:{border_name}')
-        border.set(qn('w:val'), 'none')
-        border.set(qn('w:sz'), '0')
-        border.set(qn('w:space'), '0')
-        border.set(qn('w:color'), 'auto')
-        tblBorders.append(border)
-    tblPr.append(tblBorders)
-    
-    # Set cell margins to zero to prevent extra spacing in PDF
-    tblCellMar = OxmlElement('w:tblCellMar')
-    for margin_name in ['top', 'left', 'bottom', 'right']:
-        margin = OxmlElement(f'w:{margin_name}')
-        margin.set(qn('w:w'), '0')
-        margin.set(qn('w:type'), 'dxa')
-        tblCellMar.append(margin)
-    tblPr.append(tblCellMar)
-    
-    # Set column widths (0.5" margins = 7.5" available width)
-    for row in table.rows:
-        row.cells[0].width = Inches(1.2)  # Labels column
-        row.cells[1].width = Inches(6.3)  # Content column (full width)
-        
-        # Set vertical alignment to top for both cells to reduce spacing
-        row.cells[0].vertical_alignment = WD_ALIGN_VERTICAL.TOP
-        row.cells[1].vertical_alignment = WD_ALIGN_VERTICAL.TOP
-    
-    current_row = 0
-
-    # ==================== PROFILES ====================
-    if profiles:
-        label_cell = table.rows[current_row].cells[0]
-        content_cell = table.rows[current_row].cells[1]
-        
-        label_para = label_cell.paragraphs[0]
-        label_para.paragraph_format.space_before = Pt(0)
-        label_para.paragraph_format.space_after = Pt(0)  # Zero spacing to prevent PDF conversion gaps
-        label_run = label_para.add_run('Profiles')
-        label_run.font.bold = True
-        label_run.font.size = Pt(14)  # Heading size
-        label_run.font.name = 'Calibri'
-        
-        content_para = content_cell.paragraphs[0]
-        content_para.paragraph_format.space_before = Pt(0)
-        content_para.paragraph_format.space_after = Pt(0)  # Zero spacing - LibreOffice treats this as row spacing
-        
-        # Add clickable hyperlinks for profiles (NO icons)
-        for idx, profile in enumerate(profiles):
-            platform = profile.get('platform', 'Profile')
-            url = profile.get('url', '')
-            if platform and url:
-                if idx > 0:
-                    content_para.add_run(' | ')  # Separator
-                
-                # Add hyperlink
-                hyperlink = _add_hyperlink(content_para, url, platform)
-                hyperlink.font.size = Pt(12)
-                hyperlink.font.name = 'Calibri'
-        
-        content_para.paragraph_format.space_after = Pt(16)  # Spacing between sections
-        _add_table_row_border(table.rows[current_row])
-        current_row += 1
-
-    # ==================== SUMMARY ====================
-    if summary:
-        label_cell = table.rows[current_row].cells[0]
-        content_cell = table.rows[current_row].cells[1]
-        
-        label_para = label_cell.paragraphs[0]
-        label_para.paragraph_format.space_before = Pt(0)
-        label_para.paragraph_format.space_after = Pt(0)  # Zero spacing to prevent PDF conversion gaps
-        label_run = label_para.add_run('Summary')
-        label_run.font.bold = True
-        label_run.font.size = Pt(14)  # Heading size
-        label_run.font.name = 'Calibri'
-        
-        content_para = content_cell.paragraphs[0]
-        content_para.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
-        content_para.paragraph_format.space_before = Pt(0)
-        content_para.paragraph_format.space_after = Pt(16)  # Spacing between sections
-        content_run = content_para.add_run(summary)
-        content_run.font.size = Pt(12)  # Body size
-        content_run.font.name = 'Calibri'
-        
-        _add_table_row_border(table.rows[current_row])
-        current_row += 1
-
-    # ==================== EXPERIENCE ====================
-    if experiences:
-        label_cell = table.rows[current_row].cells[0]
-        content_cell = table.rows[current_row].cells[1]
-        
-        label_para = label_cell.paragraphs[0]
-        label_para.paragraph_format.space_before = Pt(0)
-        label_para.paragraph_format.space_after = Pt(0)  # Zero spacing to prevent PDF conversion gaps
-        label_run = label_para.add_run('Experience')
-        label_run.font.bold = True
-        label_run.font.size = Pt(14)  # Heading size
-        label_run.font.name = 'Calibri'
-        
-        content_cell._element.remove(content_cell.paragraphs[0]._element)
-        
-        for idx, exp in enumerate(experiences):
-            # Company name and dates on same line
-            exp_header = content_cell.add_paragraph()
-            if idx == 0:
-                exp_header.paragraph_format.space_before = Pt(0)  # No space before first item
-            exp_header.paragraph_format.space_after = Pt(0)
-            
-            company = exp.get('company', 'Company Name')
-            company_run = exp_header.add_run(company)
-            company_run.font.bold = True
-            company_run.font.size = Pt(12)
-            company_run.font.name = 'Calibri'
-            
-            # Date aligned to far right - BOLD
-            date_str = ''
-            if exp.get('start'):
-                date_str = exp['start']
-                if exp.get('end'):
-                    date_str += f" - {exp['end']}"
-            
-            if date_str:
-                from docx.enum.text import WD_TAB_ALIGNMENT
-                tab_stops = exp_header.paragraph_format.tab_stops
-                tab_stops.add_tab_stop(Inches(6.2), WD_TAB_ALIGNMENT.RIGHT)  # Right aligned with proper padding
-                exp_header.add_run('\t')
-                date_run = exp_header.add_run(date_str)
-                date_run.font.bold = True  # Bold the date
-                date_run.font.size = Pt(12)
-                date_run.font.name = 'Calibri'
-            
-            # Job title and location on same line
-            role_para = content_cell.add_paragraph()
-            role_para.paragraph_format.space_after = Pt(0)
-            
-            role = exp.get('title', exp.get('role', 'Job Title'))
-            role_run = role_para.add_run(role)
-            role_run.font.size = Pt(12)
-            role_run.font.name = 'Calibri'
-            
-            # Location on same line as role, right-aligned
-            location = exp.get('city', exp.get('location', ''))
-            if location:
-                from docx.enum.text import WD_TAB_ALIGNMENT
-                tab_stops = role_para.paragraph_format.tab_stops
-                tab_stops.add_tab_stop(Inches(6.2), WD_TAB_ALIGNMENT.RIGHT)  # Aligned with date
-                role_para.add_run('\t')
-                loc_run = role_para.add_run(location)
-                loc_run.font.size = Pt(12)
-                loc_run.font.name = 'Calibri'
-            
-            # Bullets with proper alignment
-            bullets = exp.get('bullets', [])
-            for bullet in bullets:
-                bullet_para = content_cell.add_paragraph()
-                bullet_para.paragraph_format.space_after = Pt(0)
-                bullet_para.paragraph_format.left_indent = Inches(0.2)
-                bullet_para.paragraph_format.first_line_indent = Inches(-0.15)
-                bullet_run = bullet_para.add_run(f"• {bullet}")
-                bullet_run.font.size = Pt(12)
-                bullet_run.font.name = 'Calibri'
-            
-            # Spacing between experiences
-            if idx < len(experiences) - 1:
-                content_cell.add_paragraph().space_after = Pt(0)
-        
-        content_cell.paragraphs[-1].paragraph_format.space_after = Pt(16)  # Spacing between sections
-        _add_table_row_border(table.rows[current_row])
-        current_row += 1
-
-    # ==================== EDUCATION ====================
-    if education:
-        label_cell = table.rows[current_row].cells[0]
-        content_cell = table.rows[current_row].cells[1]
-        
-        label_para = label_cell.paragraphs[0]
-        label_para.paragraph_format.space_before = Pt(0)
-        label_para.paragraph_format.space_after = Pt(0)  # Zero spacing to prevent PDF conversion gaps
-        label_run = label_para.add_run('Education')
-        label_run.font.bold = True
-        label_run.font.size = Pt(14)  # Heading size
-        label_run.font.name = 'Calibri'
-        
-        content_cell._element.remove(content_cell.paragraphs[0]._element)
-        
-        for idx, edu in enumerate(education):
-            # Institution (bold) on left, Date (bold) on far right
-            edu_header = content_cell.add_paragraph()
-            if idx == 0:
-                edu_header.paragraph_format.space_before = Pt(0)  # No space before first item
-            edu_header.paragraph_format.space_after = Pt(0)
-            
-            institution = edu.get('institution', 'Institution Name')
-            inst_run = edu_header.add_run(institution)
-            inst_run.font.bold = True  # Bold
-            inst_run.font.size = Pt(12)
-            inst_run.font.name = 'Calibri'
-            
-            years = edu.get('years', '')
-            if years:
-                from docx.enum.text import WD_TAB_ALIGNMENT
-                tab_stops = edu_header.paragraph_format.tab_stops
-                tab_stops.add_tab_stop(Inches(6.2), WD_TAB_ALIGNMENT.RIGHT)  # Far right
-                edu_header.add_run('\t')
-                years_run = edu_header.add_run(years)
-                years_run.font.bold = True  # Bold
-                years_run.font.size = Pt(12)
-                years_run.font.name = 'Calibri'
-            
-            # Course on left, Degree type on right
-            degree_para = content_cell.add_paragraph()
-            degree_para.paragraph_format.space_after = Pt(0)
-            
-            degree = edu.get('degree', '')
-            degree_run = degree_para.add_run(degree)
-            degree_run.font.size = Pt(12)
-            degree_run.font.name = 'Calibri'
-            
-            degree_type = edu.get('degree_type', '')
-            if degree_type:
-                from docx.enum.text import WD_TAB_ALIGNMENT
-                tab_stops = degree_para.paragraph_format.tab_stops
-                tab_stops.add_tab_stop(Inches(6.2), WD_TAB_ALIGNMENT.RIGHT)  # Far right
-                degree_para.add_run('\t')
-                type_run = degree_para.add_run(degree_type)
-                type_run.font.size = Pt(12)
-                type_run.font.name = 'Calibri'
-        
-        content_cell.paragraphs[-1].paragraph_format.space_after = Pt(16)  # Spacing between sections
-        _add_table_row_border(table.rows[current_row])
-        current_row += 1
-
-    # ==================== PROJECTS ====================
-    if projects:
-        label_cell = table.rows[current_row].cells[0]
-        content_cell = table.rows[current_row].cells[1]
-        
-        label_para = label_cell.paragraphs[0]
-        label_para.paragraph_format.space_before = Pt(0)
-        label_para.paragraph_format.space_after = Pt(0)  # Zero spacing to prevent PDF conversion gaps
-        label_run = label_para.add_run('Projects')
-        label_run.font.bold = True
-        label_run.font.size = Pt(14)  # Heading size
-        label_run.font.name = 'Calibri'
-        
-        content_cell._element.remove(content_cell.paragraphs[0]._element)
-
-        for idx, proj in enumerate(projects):
-            proj_para = content_cell.add_paragraph()
-            if idx == 0:
-                proj_para.paragraph_format.space_before = Pt(0)  # No space before first item
-            proj_para.paragraph_format.space_after = Pt(0)
-            proj_para.paragraph_format.left_indent = Inches(0.2)
-            proj_para.paragraph_format.first_line_indent = Inches(-0.15)
-            proj_details = proj.get('details', '')
-            if proj_details:
-                proj_run = proj_para.add_run(f"• {proj_details}")
-                proj_run.font.size = Pt(12)
-                proj_run.font.name = 'Calibri'
-        
-        content_cell.paragraphs[-1].paragraph_format.space_after = Pt(16)  # Spacing between sections
-        _add_table_row_border(table.rows[current_row])
-        current_row += 1
-
-    # ==================== REFERENCES ====================
-    if references:
-        label_cell = table.rows[current_row].cells[0]
-        content_cell = table.rows[current_row].cells[1]
-        
-        label_para = label_cell.paragraphs[0]
-        label_para.paragraph_format.space_before = Pt(0)
-        label_para.paragraph_format.space_after = Pt(0)  # Zero spacing to prevent PDF conversion gaps
-        label_run = label_para.add_run('References')
-        label_run.font.bold = True
-        label_run.font.size = Pt(14)  # Heading size
-        label_run.font.name = 'Calibri'
-        
-        content_cell._element.remove(content_cell.paragraphs[0]._element)
-        
-        for idx, ref in enumerate(references):
-            name_para = content_cell.add_paragraph()
-            if idx == 0:
-                name_para.paragraph_format.space_before = Pt(0)  # No space before first item
-            name_para.paragraph_format.space_after = Pt(0)
-            name_run = name_para.add_run(ref.get('name', 'Reference Name'))
-            name_run.font.bold = True
-            name_run.font.size = Pt(12)
-            name_run.font.name = 'Calibri'
-            
-            ref_title = ref.get('title', '')
-            if ref_title:
-                title_para = content_cell.add_paragraph(ref_title)
-                title_para.paragraph_format.space_after = Pt(0)
-                for run in title_para.runs:
-                    run.font.size = Pt(12)
-                    run.font.name = 'Calibri'
-            
-            ref_org = ref.get('organization', '')
-            if ref_org:
-                org_para = content_cell.add_paragraph(ref_org)
-                org_para.paragraph_format.space_after = Pt(0)
-                for run in org_para.runs:
-                    run.font.size = Pt(12)
-                    run.font.name = 'Calibri'
-        
-        content_cell.paragraphs[-1].paragraph_format.space_after = Pt(16)  # Spacing between sections
-        _add_table_row_border(table.rows[current_row])
-        current_row += 1
-
-    # ==================== SKILLS ====================
-    if skills:
-        label_cell = table.rows[current_row].cells[0]
-        content_cell = table.rows[current_row].cells[1]
-        
-        label_para = label_cell.paragraphs[0]
-        label_para.paragraph_format.space_before = Pt(0)
-        label_para.paragraph_format.space_after = Pt(0)  # Zero spacing to prevent PDF conversion gaps
-        label_run = label_para.add_run('Skills')
-        label_run.font.bold = True
-        label_run.font.size = Pt(14)  # Heading size
-        label_run.font.name = 'Calibri'
-        
-        content_cell._element.remove(content_cell.paragraphs[0]._element)
-        
-        # Split skills into 2 equal columns
-        from docx.enum.text import WD_TAB_ALIGNMENT
-        skills_per_col = (len(skills) + 1) // 2  # Round up
-        col1 = skills[:skills_per_col]
-        col2 = skills[skills_per_col:]
-        
-        # Create skill lines with 2 columns
-        for i in range(max(len(col1), len(col2))):
-            skill_line = content_cell.add_paragraph()
-            if i == 0:
-                skill_line.paragraph_format.space_before = Pt(0)  # No space before first item
-            skill_line.paragraph_format.space_after = Pt(0)
-            
-            # Set up tab stop for 2 equal columns
-            tab_stops = skill_line.paragraph_format.tab_stops
-            tab_stops.add_tab_stop(Inches(3.75), WD_TAB_ALIGNMENT.LEFT)  # Column 2 start (adjusted for 0.5" margins)
-            
-            # Column 1 - BOLD
-            if i < len(col1):
-                skill1_run = skill_line.add_run(col1[i])
-                skill1_run.font.bold = True  # Bold
-                skill1_run.font.size = Pt(12)
-                skill1_run.font.name = 'Calibri'
-            
-            skill_line.add_run('\t')
-            
-            # Column 2 - BOLD
-            if i < len(col2):
-                skill2_run = skill_line.add_run(col2[i])
-                skill2_run.font.bold = True  # Bold
-                skill2_run.font.size = Pt(12)
-                skill2_run.font.name = 'Calibri'
-        
-        _add_table_row_border(table.rows[current_row])
+    # Rows are appended as sections turn out to have content; the table is
+    # dropped again at the end if none did.
+    table = _add_layout_table(doc)
+
+    # One label/content row per section that has content, in display order
+    for label, data, fill in (
+        ('Profiles', profiles, _fill_profiles_cell),
+        ('Summary', summary, _fill_summary_cell),
+        ('Experience', experiences, _fill_experience_cell),
+        ('Education', education, _fill_education_cell),
+        ('Projects', projects, _fill_projects_cell),
+        ('References', references, _fill_references_cell),
+        ('Skills', skills, _fill_skills_cell),
+    ):
+        if data:
+            fill(_add_layout_row(table, label), data)
+
+    if not table.rows:
+        table._tbl.getparent().remove(table._tbl)
 
     # Save to bytes
     buffer = BytesIO()
@@ -573,15 +331,8 @@ def _render_template_2(answers: dict) -> bytes:
     - No icons, professional formatting
     - Calibri font, refined spacing
     """
-    doc = Document()
-
-    # Set margins to match template 1
-    sections = doc.sections
-    for section in sections:
-        section.top_margin = Inches(0.5)
-        section.bottom_margin = Inches(0.5)
-        section.left_margin = Inches(0.5)
-        section.right_margin = Inches(0.5)
+    # Margins match template 1
+    doc = _new_document(0.5)
 
     # Get data
     basics = answers.get('basics', {})
@@ -598,21 +349,14 @@ def _render_template_2(answers: dict) -> bytes:
     name = basics.get('name', 'Your Name')
     name_para = doc.add_paragraph()
     name_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    name_run = name_para.add_run(name.upper())
-    name_run.bold = True
-    name_run.font.size = Pt(26)
-    name_run.font.name = 'Calibri'
-    name_run.font.color.rgb = RGBColor(0, 51, 102)  # Dark blue
+    _add_run(name_para, name.upper(), _rpr('Calibri', 26, bold=True, color='003366'))  # Dark blue
     name_para.paragraph_format.space_after = Pt(2)
     
     # Title (centered, gray)
     if basics.get('title'):
         title_para = doc.add_paragraph()
         title_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        title_run = title_para.add_run(basics['title'])
-        title_run.font.size = Pt(13)
-        title_run.font.name = 'Calibri'
-        title_run.font.color.rgb = RGBColor(80, 80, 80)
+        _add_run(title_para, basics['title'], _rpr('Calibri', 13, color='505050'))
         title_para.paragraph_format.space_after = Pt(2)
     
     # Contact info (centered, no icons)
@@ -627,10 +371,7 @@ def _render_template_2(answers: dict) -> bytes:
     if contact_parts:
         contact_para = doc.add_paragraph()
         contact_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        contact_run = contact_para.add_run(' | '.join(contact_parts))
-        contact_run.font.size = Pt(11)
-        contact_run.font.name = 'Calibri'
-        contact_run.font.color.rgb = RGBColor(60, 60, 60)
+        _add_run(contact_para, ' | '.join(contact_parts), _rpr('Calibri', 11, color='3C3C3C'))
         contact_para.paragraph_format.space_after = Pt(16)
     
     # Horizontal line separator
@@ -640,11 +381,7 @@ def _render_template_2(answers: dict) -> bytes:
     # ==================== PROFILES ====================
     if profiles:
         profiles_heading = doc.add_paragraph()
-        profiles_heading_run = profiles_heading.add_run('PROFILES')
-        profiles_heading_run.bold = True
-        profiles_heading_run.font.size = Pt(13)
-        profiles_heading_run.font.name = 'Calibri'
-        profiles_heading_run.font.color.rgb = RGBColor(0, 51, 102)
+        _add_run(profiles_heading, 'PROFILES', _rpr('Calibri', 13, bold=True, color='003366'))
         profiles_heading.paragraph_format.space_after = Pt(6)
         
         profiles_para = doc.add_paragraph()
@@ -660,96 +397,38 @@ def _render_template_2(answers: dict) -> bytes:
     # ==================== SUMMARY ====================
     if summary:
         summary_heading = doc.add_paragraph()
-        summary_heading_run = summary_heading.add_run('PROFESSIONAL SUMMARY')
-        summary_heading_run.bold = True
-        summary_heading_run.font.size = Pt(13)
-        summary_heading_run.font.name = 'Calibri'
-        summary_heading_run.font.color.rgb = RGBColor(0, 51, 102)
+        _add_run(summary_heading, 'PROFESSIONAL SUMMARY', _rpr('Calibri', 13, bold=True, color='003366'))
         summary_heading.paragraph_format.space_after = Pt(6)
         
-        summary_para = doc.add_paragraph(summary)
+        summary_para = _add_text_paragraph(doc, summary, _rpr('Calibri', 11))
         summary_para.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
         summary_para.paragraph_format.space_after = Pt(14)
-        for run in summary_para.runs:
-            run.font.size = Pt(11)
-            run.font.name = 'Calibri'
     
     # ==================== SKILLS ====================
     if skills:
         skills_heading = doc.add_paragraph()
-        skills_heading_run = skills_heading.add_run('KEY SKILLS')
-        skills_heading_run.bold = True
-        skills_heading_run.font.size = Pt(13)
-        skills_heading_run.font.name = 'Calibri'
-        skills_heading_run.font.color.rgb = RGBColor(0, 51, 102)
+        _add_run(skills_heading, 'KEY SKILLS', _rpr('Calibri', 13, bold=True, color='003366'))
         skills_heading.paragraph_format.space_after = Pt(6)
         
         skills_text = ' • '.join(skills)
-        skills_para = doc.add_paragraph(skills_text)
+        skills_para = _add_text_paragraph(doc, skills_text, _rpr('Calibri', 11))
         skills_para.paragraph_format.space_after = Pt(14)
-        for run in skills_para.runs:
-            run.font.size = Pt(11)
-            run.font.name = 'Calibri'
 
     # ==================== EXPERIENCE ====================
     if experiences:
         exp_heading = doc.add_paragraph()
-        exp_heading_run = exp_heading.add_run('PROFESSIONAL EXPERIENCE')
-        exp_heading_run.bold = True
-        exp_heading_run.font.size = Pt(13)
-        exp_heading_run.font.name = 'Calibri'
-        exp_heading_run.font.color.rgb = RGBColor(0, 51, 102)
+        _add_run(exp_heading, 'PROFESSIONAL EXPERIENCE', _rpr('Calibri', 13, bold=True, color='003366'))
         exp_heading.paragraph_format.space_after = Pt(6)
         
-        for idx, exp in enumerate(experiences):
-            # Company (bold) and dates
-            comp_para = doc.add_paragraph()
-            comp_run = comp_para.add_run(exp.get('company', 'Company'))
-            comp_run.bold = True
-            comp_run.font.size = Pt(12)
-            comp_run.font.name = 'Calibri'
-            
-            dates = f"{exp.get('start', '')} - {exp.get('end', '')}"
-            if dates.strip() != ' - ':
-                comp_para.add_run(f"  |  {dates}")
-            comp_para.paragraph_format.space_after = Pt(2)
-            
-            # Title and location
-            title_para = doc.add_paragraph()
-            title_run = title_para.add_run(exp.get('title', exp.get('role', 'Position')))
-            title_run.italic = True
-            title_run.font.size = Pt(11)
-            title_run.font.name = 'Calibri'
-            
-            location = exp.get('city', exp.get('location', ''))
-            if location:
-                title_para.add_run(f" – {location}")
-            title_para.paragraph_format.space_after = Pt(4)
-            
-            # Bullets
-            for bullet in exp.get('bullets', []):
-                bullet_para = doc.add_paragraph()
-                bullet_para.paragraph_format.left_indent = Inches(0.2)
-                bullet_para.paragraph_format.first_line_indent = Inches(-0.15)
-                bullet_para.paragraph_format.space_after = Pt(2)
-                bullet_run = bullet_para.add_run(f"• {bullet}")
-                bullet_run.font.size = Pt(11)
-                bullet_run.font.name = 'Calibri'
-            
-            # Spacer between jobs
-            if idx < len(experiences) - 1:
-                doc.add_paragraph().paragraph_format.space_after = Pt(8)
-        
-        doc.add_paragraph().paragraph_format.space_after = Pt(6)
+        # Entries with an 8pt spacer between jobs and 6pt after the last
+        _append_paragraphs(doc, '<w:p><w:pPr><w:spacing w:after="160"/></w:pPr></w:p>'.join(
+            _build_t2_experience_xml(exp) for exp in experiences
+        ) + '<w:p><w:pPr><w:spacing w:after="120"/></w:pPr></w:p>')
 
     # ==================== EDUCATION ====================
     if education:
         edu_heading = doc.add_paragraph()
-        edu_heading_run = edu_heading.add_run('EDUCATION')
-        edu_heading_run.bold = True
-        edu_heading_run.font.size = Pt(13)
-        edu_heading_run.font.name = 'Calibri'
-        edu_heading_run.font.color.rgb = RGBColor(0, 51, 102)
+        _add_run(edu_heading, 'EDUCATION', _rpr('Calibri', 13, bold=True, color='003366'))
         edu_heading.paragraph_format.space_after = Pt(6)
 
         for edu in education:
@@ -761,30 +440,20 @@ def _render_template_2(answers: dict) -> bytes:
             edu_para.paragraph_format.space_after = Pt(4)
             
             # Institution and year
-            inst_run = edu_para.add_run(f"{institution}")
-            inst_run.bold = True
-            inst_run.font.size = Pt(11)
-            inst_run.font.name = 'Calibri'
+            _add_run(edu_para, f"{institution}", _rpr('Calibri', 11, bold=True))
             
             if years:
                 edu_para.add_run(f"  |  {years}")
             
             # Degree
             if degree:
-                degree_para = doc.add_paragraph(degree)
+                degree_para = _add_text_paragraph(doc, degree, _rpr('Calibri', 11))
                 degree_para.paragraph_format.space_after = Pt(6)
-                for run in degree_para.runs:
-                    run.font.size = Pt(11)
-                    run.font.name = 'Calibri'
     
     # ==================== CERTIFICATIONS ====================
     if certifications:
         cert_heading = doc.add_paragraph()
-        cert_heading_run = cert_heading.add_run('CERTIFICATIONS')
-        cert_heading_run.bold = True
-        cert_heading_run.font.size = Pt(13)
-        cert_heading_run.font.name = 'Calibri'
-        cert_heading_run.font.color.rgb = RGBColor(0, 51, 102)
+        _add_run(cert_heading, 'CERTIFICATIONS', _rpr('Calibri', 13, bold=True, color='003366'))
         cert_heading.paragraph_format.space_after = Pt(6)
         
         for cert in certifications:
@@ -796,11 +465,8 @@ def _render_template_2(answers: dict) -> bytes:
             if cert_year:
                 cert_text += f", {cert_year}"
             
-            cert_para = doc.add_paragraph(f"• {cert_text}")
+            cert_para = _add_text_paragraph(doc, f"• {cert_text}", _rpr('Calibri', 11))
             cert_para.paragraph_format.space_after = Pt(4)
-            for run in cert_para.runs:
-                run.font.size = Pt(11)
-                run.font.name = 'Calibri'
     
     # Save to bytes
     buffer = BytesIO()
@@ -819,15 +485,8 @@ def _render_template_3(answers: dict) -> bytes:
     - Authoritative, commanding appearance
     - Arial Black/Arial for bold impact
     """
-    doc = Document()
-    
-    # Set generous margins for executive presence
-    sections = doc.sections
-    for section in sections:
-        section.top_margin = Inches(0.75)
-        section.bottom_margin = Inches(0.75)
-        section.left_margin = Inches(0.75)
-        section.right_margin = Inches(0.75)
+    # Generous margins for executive presence
+    doc = _new_document(0.75)
     
     # Get data
     basics = answers.get('basics', {})
@@ -844,21 +503,14 @@ def _render_template_3(answers: dict) -> bytes:
     name = basics.get('name', 'Your Name')
     name_para = doc.add_paragraph()
     name_para.alignment = WD_ALIGN_PARAGRAPH.LEFT
-    name_run = name_para.add_run(name.upper())
-    name_run.bold = True
-    name_run.font.size = Pt(28)
-    name_run.font.name = 'Arial'
+    _add_run(name_para, name.upper(), _rpr('Arial', 28, bold=True))
     name_para.paragraph_format.space_after = Pt(4)
     
     # Title (larger, bold)
     if basics.get('title'):
         title_para = doc.add_paragraph()
         title_para.alignment = WD_ALIGN_PARAGRAPH.LEFT
-        title_run = title_para.add_run(basics['title'].upper())
-        title_run.bold = True
-        title_run.font.size = Pt(14)
-        title_run.font.name = 'Arial'
-        title_run.font.color.rgb = RGBColor(60, 60, 60)
+        _add_run(title_para, basics['title'].upper(), _rpr('Arial', 14, bold=True, color='3C3C3C'))
         title_para.paragraph_format.space_after = Pt(4)
     
     # Contact info (no icons, pipe separated)
@@ -873,10 +525,7 @@ def _render_template_3(answers: dict) -> bytes:
     if contact_parts:
         contact_para = doc.add_paragraph()
         contact_para.alignment = WD_ALIGN_PARAGRAPH.LEFT
-        contact_run = contact_para.add_run(' | '.join(contact_parts))
-        contact_run.font.size = Pt(11)
-        contact_run.font.name = 'Arial'
-        contact_run.font.color.rgb = RGBColor(80, 80, 80)
+        _add_run(contact_para, ' | '.join(contact_parts), _rpr('Arial', 11, color='505050'))
         contact_para.paragraph_format.space_after = Pt(18)
     
     # Thick horizontal line separator
@@ -886,10 +535,7 @@ def _render_template_3(answers: dict) -> bytes:
     # ==================== PROFILES ====================
     if profiles:
         profiles_heading = doc.add_paragraph()
-        profiles_heading_run = profiles_heading.add_run('PROFESSIONAL PROFILES')
-        profiles_heading_run.bold = True
-        profiles_heading_run.font.size = Pt(14)
-        profiles_heading_run.font.name = 'Arial'
+        _add_run(profiles_heading, 'PROFESSIONAL PROFILES', _rpr('Arial', 14, bold=True))
         profiles_heading.paragraph_format.space_after = Pt(8)
         
         profiles_para = doc.add_paragraph()
@@ -905,97 +551,38 @@ def _render_template_3(answers: dict) -> bytes:
     # ==================== SUMMARY ====================
     if summary:
         summary_heading = doc.add_paragraph()
-        summary_heading_run = summary_heading.add_run('EXECUTIVE SUMMARY')
-        summary_heading_run.bold = True
-        summary_heading_run.font.size = Pt(14)
-        summary_heading_run.font.name = 'Arial'
+        _add_run(summary_heading, 'EXECUTIVE SUMMARY', _rpr('Arial', 14, bold=True))
         summary_heading.paragraph_format.space_after = Pt(8)
         
-        summary_para = doc.add_paragraph(summary)
+        summary_para = _add_text_paragraph(doc, summary, _rpr('Arial', 11))
         summary_para.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
         summary_para.paragraph_format.space_after = Pt(16)
-        for run in summary_para.runs:
-            run.font.size = Pt(11)
-            run.font.name = 'Arial'
     
     # ==================== CORE COMPETENCIES ====================
     if skills:
         skills_heading = doc.add_paragraph()
-        skills_heading_run = skills_heading.add_run('CORE COMPETENCIES')
-        skills_heading_run.bold = True
-        skills_heading_run.font.size = Pt(14)
-        skills_heading_run.font.name = 'Arial'
+        _add_run(skills_heading, 'CORE COMPETENCIES', _rpr('Arial', 14, bold=True))
         skills_heading.paragraph_format.space_after = Pt(8)
         
         skills_text = '  •  '.join(skills)
-        skills_para = doc.add_paragraph(skills_text)
+        skills_para = _add_text_paragraph(doc, skills_text, _rpr('Arial', 11, bold=True))
         skills_para.paragraph_format.space_after = Pt(16)
-        for run in skills_para.runs:
-            run.font.size = Pt(11)
-            run.font.name = 'Arial'
-            run.bold = True
     
     # ==================== PROFESSIONAL EXPERIENCE ====================
     if experiences:
         exp_heading = doc.add_paragraph()
-        exp_heading_run = exp_heading.add_run('PROFESSIONAL EXPERIENCE')
-        exp_heading_run.bold = True
-        exp_heading_run.font.size = Pt(14)
-        exp_heading_run.font.name = 'Arial'
+        _add_run(exp_heading, 'PROFESSIONAL EXPERIENCE', _rpr('Arial', 14, bold=True))
         exp_heading.paragraph_format.space_after = Pt(8)
         
-        for idx, exp in enumerate(experiences):
-            # Company (bold, ALL CAPS, larger)
-            comp_para = doc.add_paragraph()
-            comp_run = comp_para.add_run(exp.get('company', 'Company').upper())
-            comp_run.bold = True
-            comp_run.font.size = Pt(12)
-            comp_run.font.name = 'Arial'
-            comp_para.paragraph_format.space_before = Pt(8) if idx > 0 else Pt(0)
-            comp_para.paragraph_format.space_after = Pt(3)
-            
-            # Title and dates
-            title_para = doc.add_paragraph()
-            title_run = title_para.add_run(exp.get('title', exp.get('role', 'Position')))
-            title_run.bold = True
-            title_run.font.size = Pt(11)
-            title_run.font.name = 'Arial'
-            
-            dates = f"{exp.get('start', '')} - {exp.get('end', '')}"
-            if dates.strip() != ' - ':
-                title_para.add_run(f"  |  {dates}")
-            title_para.paragraph_format.space_after = Pt(2)
-            
-            # Location
-            location = exp.get('city', exp.get('location', ''))
-            if location:
-                loc_para = doc.add_paragraph(location)
-                loc_para.paragraph_format.space_after = Pt(5)
-                for run in loc_para.runs:
-                    run.font.size = Pt(10)
-                    run.font.name = 'Arial'
-                    run.italic = True
-                    run.font.color.rgb = RGBColor(80, 80, 80)
-            
-            # Bullets
-            for bullet in exp.get('bullets', []):
-                bullet_para = doc.add_paragraph()
-                bullet_para.paragraph_format.left_indent = Inches(0.25)
-                bullet_para.paragraph_format.first_line_indent = Inches(-0.2)
-                bullet_para.paragraph_format.space_after = Pt(4)
-                bullet_run = bullet_para.add_run(f"▪ {bullet}")
-                bullet_run.font.size = Pt(11)
-                bullet_run.font.name = 'Arial'
-        
-        doc.add_paragraph().paragraph_format.space_after = Pt(8)
+        # Entries, then 8pt before the next section
+        _append_paragraphs(doc, ''.join(
+            _build_t3_experience_xml(exp, first=idx == 0) for idx, exp in enumerate(experiences)
+        ) + '<w:p><w:pPr><w:spacing w:after="160"/></w:pPr></w:p>')
     
     # ==================== EDUCATION ====================
     if education:
         edu_heading = doc.add_paragraph()
-        edu_heading_run = edu_heading.add_run('EDUCATION')
-        edu_heading_run.bold = True
-        edu_heading_run.font.size = Pt(14)
-        edu_heading_run.font.name = 'Arial'
+        _add_run(edu_heading, 'EDUCATION', _rpr('Arial', 14, bold=True))
         edu_heading.paragraph_format.space_after = Pt(8)
         
         for edu in education:
@@ -1005,10 +592,7 @@ def _render_template_3(answers: dict) -> bytes:
             
             # Institution and year
             edu_para = doc.add_paragraph()
-            inst_run = edu_para.add_run(f"{institution}")
-            inst_run.bold = True
-            inst_run.font.size = Pt(11)
-            inst_run.font.name = 'Arial'
+            _add_run(edu_para, f"{institution}", _rpr('Arial', 11, bold=True))
             
             if years:
                 edu_para.add_run(f"  |  {years}")
@@ -1016,19 +600,13 @@ def _render_template_3(answers: dict) -> bytes:
             
             # Degree
             if degree:
-                degree_para = doc.add_paragraph(degree)
+                degree_para = _add_text_paragraph(doc, degree, _rpr('Arial', 11))
                 degree_para.paragraph_format.space_after = Pt(8)
-                for run in degree_para.runs:
-                    run.font.size = Pt(11)
-                    run.font.name = 'Arial'
     
     # ==================== CERTIFICATIONS ====================
     if certifications:
         cert_heading = doc.add_paragraph()
-        cert_heading_run = cert_heading.add_run('CERTIFICATIONS & CREDENTIALS')
-        cert_heading_run.bold = True
-        cert_heading_run.font.size = Pt(14)
-        cert_heading_run.font.name = 'Arial'
+        _add_run(cert_heading, 'CERTIFICATIONS & CREDENTIALS', _rpr('Arial', 14, bold=True))
         cert_heading.paragraph_format.space_after = Pt(8)
         
         for cert in certifications:
@@ -1042,20 +620,14 @@ def _render_template_3(answers: dict) -> bytes:
             if cert_year:
                 cert_text += f", {cert_year}"
             
-            cert_para = doc.add_paragraph(f"▪ {cert_text}")
+            cert_para = _add_text_paragraph(doc, f"▪ {cert_text}", _rpr('Arial', 11))
             cert_para.paragraph_format.left_indent = Inches(0.25)
             cert_para.paragraph_format.space_after = Pt(5)
-            for run in cert_para.runs:
-                run.font.size = Pt(11)
-                run.font.name = 'Arial'
     
     # ==================== PROJECTS ====================
     if projects:
         proj_heading = doc.add_paragraph()
-        proj_heading_run = proj_heading.add_run('KEY PROJECTS')
-        proj_heading_run.bold = True
-        proj_heading_run.font.size = Pt(14)
-        proj_heading_run.font.name = 'Arial'
+        _add_run(proj_heading, 'KEY PROJECTS', _rpr('Arial', 14, bold=True))
         proj_heading.paragraph_format.space_after = Pt(8)
         
         for proj in projects:
@@ -1064,13 +636,9 @@ def _render_template_3(answers: dict) -> bytes:
             
             if proj_name and proj_details:
                 proj_para = doc.add_paragraph()
-                proj_name_run = proj_para.add_run(f"{proj_name}: ")
-                proj_name_run.bold = True
-                proj_para.add_run(proj_details)
+                _add_run(proj_para, f"{proj_name}: ", _rpr('Arial', 11, bold=True))
+                _add_run(proj_para, proj_details, _rpr('Arial', 11))
                 proj_para.paragraph_format.space_after = Pt(6)
-                for run in proj_para.runs:
-                    run.font.size = Pt(11)
-                    run.font.name = 'Arial'
 
     # Save to bytes
     buffer = BytesIO()
@@ -1087,23 +655,20 @@ def render_cv(job: Job) -> bytes:
     CV now uses the EXACT SAME layout as Resume for consistency.
     The only difference is the document type label - layout is identical.
     """
-    answers = job.answers or {}
-    selected_template = answers.get("template", "template_1")
-    
     # Use the same template renderers as Resume
-    if selected_template == "template_2":
-        return _render_template_2(answers)
-    elif selected_template == "template_3":
-        return _render_template_3(answers)
-    else:
-        # Use the same Template 1 as Resume (perfected layout)
-        return _render_template_1(answers)
+    return _render_resume_answers(job.answers or {})
 
 
 # NOTE: Old _render_cv_template_1 function removed - CV now uses same layout as Resume
 
 
 
+@lru_cache(maxsize=1)
+def _letter_date(ordinal: int) -> str:
+    """Cover letter date line ('January 05, 2026'), formatted once per day."""
+    return date.fromordinal(ordinal).strftime("%B %d, %Y")
+
+
 def render_cover_letter(job: Job) -> bytes:
     """
     Generate professional cover letter DOCX following HR industry standards.
@@ -1130,58 +695,33 @@ def render_cover_letter(job: Job) -> bytes:
     key_skills = answers.get("cover_key_skills", [])
     company_goal = answers.get("company_goal", "the organization's goals")
 
-    doc = Document()
-
-    # Set margins - professional business letter format
-    for section in doc.sections:
-        section.top_margin = Inches(1)
-        section.bottom_margin = Inches(1)
-        section.left_margin = Inches(1)
-        section.right_margin = Inches(1)
+    # Margins - professional business letter format
+    doc = _new_document(1)
 
     # ==================== HEADER (Contact Info) ====================
     # Name
-    name_para = doc.add_paragraph(name)
+    name_para = _add_text_paragraph(doc, name, _rpr('Calibri', 12, bold=True))
     name_para.alignment = WD_ALIGN_PARAGRAPH.LEFT
     name_para.paragraph_format.space_after = Pt(2)
-    for run in name_para.runs:
-        run.font.name = 'Calibri'
-        run.font.size = Pt(12)
-        run.font.bold = True
     
     # Contact line: LinkedIn | Phone | Email
-    contact_parts = []
-    if linkedin:
-        contact_parts.append(linkedin)
-    if phone:
-        contact_parts.append(phone)
-    if email:
-        contact_parts.append(email)
+    # Joined once; the signature repeats the same line
+    contact_line = " | ".join(p for p in (linkedin, phone, email) if p)
     
-    if contact_parts:
-        contact_para = doc.add_paragraph(" | ".join(contact_parts))
+    if contact_line:
+        contact_para = _add_text_paragraph(doc, contact_line, _rpr('Calibri', 11))
         contact_para.alignment = WD_ALIGN_PARAGRAPH.LEFT
         contact_para.paragraph_format.space_after = Pt(20)
-        for run in contact_para.runs:
-            run.font.name = 'Calibri'
-            run.font.size = Pt(11)
 
     # ==================== DATE ====================
-    from datetime import datetime
-    date_para = doc.add_paragraph(datetime.now().strftime("%B %d, %Y"))
+    date_para = _add_text_paragraph(doc, _letter_date(date.today().toordinal()), _rpr('Calibri', 11))
     date_para.alignment = WD_ALIGN_PARAGRAPH.LEFT
     date_para.paragraph_format.space_after = Pt(20)
-    for run in date_para.runs:
-        run.font.name = 'Calibri'
-        run.font.size = Pt(11)
 
     # ==================== GREETING ====================
-    greeting_para = doc.add_paragraph("Dear Hiring Manager,")
+    greeting_para = _add_text_paragraph(doc, "Dear Hiring Manager,", _rpr('Calibri', 11))
     greeting_para.alignment = WD_ALIGN_PARAGRAPH.LEFT
     greeting_para.paragraph_format.space_after = Pt(12)
-    for run in greeting_para.runs:
-        run.font.name = 'Calibri'
-        run.font.size = Pt(11)
 
     # ==================== OPENING PARAGRAPH ====================
     opening = (
@@ -1190,12 +730,9 @@ def render_cover_letter(job: Job) -> bytes:
         f"improvements in key areas of responsibility. I am particularly excited about this "
         f"opportunity because {interest_reason}."
     )
-    opening_para = doc.add_paragraph(opening)
+    opening_para = _add_text_paragraph(doc, opening, _rpr('Calibri', 11))
     opening_para.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
     opening_para.paragraph_format.space_after = Pt(12)
-    for run in opening_para.runs:
-        run.font.name = 'Calibri'
-        run.font.size = Pt(11)
 
     # ==================== BODY PARAGRAPH (Experience & Achievements) ====================
     body_text = (
@@ -1206,20 +743,16 @@ def render_cover_letter(job: Job) -> bytes:
     if achievement_2:
         body_text += f" I also {achievement_2}"
     
-    body_para = doc.add_paragraph(body_text)
+    body_para = _add_text_paragraph(doc, body_text, _rpr('Calibri', 11))
     body_para.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
     body_para.paragraph_format.space_after = Pt(12)
-    for run in body_para.runs:
-        run.font.name = 'Calibri'
-        run.font.size = Pt(11)
 
     # ==================== SKILLS PARAGRAPH ====================
     if key_skills:
-        skills_text = ", ".join(key_skills[:-1])
-        if len(key_skills) > 1:
-            skills_text += f", and {key_skills[-1]}"
-        else:
-            skills_text = key_skills[0] if key_skills else ""
+        skills_text = (
+            f"{', '.join(key_skills[:-1])}, and {key_skills[-1]}" if len(key_skills) > 1
+            else key_skills[0]
+        )
         
         skills_para_text = (
             f"I bring a pragmatic combination of strategic leadership and hands-on operational "
@@ -1227,12 +760,9 @@ def render_cover_letter(job: Job) -> bytes:
             f"in these areas can support {company}'s goals for {company_goal}."
         )
         
-        skills_para = doc.add_paragraph(skills_para_text)
+        skills_para = _add_text_paragraph(doc, skills_para_text, _rpr('Calibri', 11))
         skills_para.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
         skills_para.paragraph_format.space_after = Pt(12)
-        for run in skills_para.runs:
-            run.font.name = 'Calibri'
-            run.font.size = Pt(11)
 
     # ==================== CLOSING PARAGRAPH ====================
     closing_text = (
@@ -1240,35 +770,23 @@ def render_cover_letter(job: Job) -> bytes:
         "for a conversation at your convenience. I look forward to the possibility of contributing "
         "to your team."
     )
-    closing_para = doc.add_paragraph(closing_text)
+    closing_para = _add_text_paragraph(doc, closing_text, _rpr('Calibri', 11))
     closing_para.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
     closing_para.paragraph_format.space_after = Pt(20)
-    for run in closing_para.runs:
-        run.font.name = 'Calibri'
-        run.font.size = Pt(11)
 
     # ==================== SIGNATURE ====================
-    sincerely_para = doc.add_paragraph("Sincerely,")
+    sincerely_para = _add_text_paragraph(doc, "Sincerely,", _rpr('Calibri', 11))
     sincerely_para.alignment = WD_ALIGN_PARAGRAPH.LEFT
     sincerely_para.paragraph_format.space_after = Pt(20)
-    for run in sincerely_para.runs:
-        run.font.name = 'Calibri'
-        run.font.size = Pt(11)
     
-    signature_para = doc.add_paragraph(name)
+    signature_para = _add_text_paragraph(doc, name, _rpr('Calibri', 11))
     signature_para.alignment = WD_ALIGN_PARAGRAPH.LEFT
     signature_para.paragraph_format.space_after = Pt(2)
-    for run in signature_para.runs:
-        run.font.name = 'Calibri'
-        run.font.size = Pt(11)
     
     # Contact line in signature
-    if contact_parts:
-        sig_contact_para = doc.add_paragraph(" | ".join(contact_parts))
+    if contact_line:
+        sig_contact_para = _add_text_paragraph(doc, contact_line, _rpr('Calibri', 10))
         sig_contact_para.alignment = WD_ALIGN_PARAGRAPH.LEFT
-        for run in sig_contact_para.runs:
-            run.font.name = 'Calibri'
-            run.font.size = Pt(10)
 
     # Save to bytes
     buffer = BytesIO()
@@ -1286,27 +804,18 @@ def render_revamp(job: Job) -> bytes:
     answers = job.answers or {}
     improved_text = answers.get("revamped_content") or answers.get("original_content") or ""
 
-    doc = Document()
-
-    # Margins
-    for section in doc.sections:
-        section.top_margin = Inches(0.75)
-        section.bottom_margin = Inches(0.75)
-        section.left_margin = Inches(0.75)
-        section.right_margin = Inches(0.75)
+    doc = _new_document(0.75)
 
     _add_section_heading(doc, "IMPROVED RESUME CONTENT")
 
     if not improved_text:
-        para = doc.add_paragraph("No content provided.")
-        _set_body_font(para)
+        _add_text_paragraph(doc, "No content provided.", _BODY_RPR)
     else:
         for line in improved_text.splitlines():
             if not line.strip():
                 doc.add_paragraph()
                 continue
-            para = doc.add_paragraph(line.strip())
-            _set_body_font(para)
+            _add_text_paragraph(doc, line.strip(), _BODY_RPR)
 
     buffer = BytesIO()
     doc.save(buffer)
@@ -1315,92 +824,337 @@ def render_revamp(job: Job) -> bytes:
     return buffer.getvalue()
 
 
+# Bottom rule paragraph borders: the standard line and a thinner one for CV headings
+_BORDER_BOTTOM_XML = '<w:pBdr><w:bottom w:val="single" w:sz="6" w:space="1" w:color="000000"/></w:pBdr>'
+_BORDER_BOTTOM_THIN_XML = _BORDER_BOTTOM_XML.replace('w:sz="6"', 'w:sz="4"')
+
+
 def _add_section_heading(doc: Document, text: str):
-    """Add a section heading with consistent styling"""
-    heading = doc.add_paragraph()
-    heading_run = heading.add_run(text)
-    heading_run.font.bold = True
-    heading_run.font.size = Pt(12)
-    heading_run.font.name = 'Arial'
-    heading_run.font.color.rgb = RGBColor(0, 0, 0)
-
-    # Add bottom border
-    from docx.oxml.shared import OxmlElement
-    from docx.oxml.ns import qn
-
-    pPr = heading._element.get_or_add_pPr()
-    pBdr = OxmlElement('w:pBdr')
-    bottom = OxmlElement('w:bottom')
-    bottom.set(qn('w:val'), 'single')
-    bottom.set(qn('w:sz'), '6')  # Border width
-    bottom.set(qn('w:space'), '1')
-    bottom.set(qn('w:color'), '000000')
-    pBdr.append(bottom)
-    pPr.append(pBdr)
+    """Add a section heading with consistent styling and a bottom border"""
+    _append_paragraphs(
+        doc,
+        f'<w:p><w:pPr>{_BORDER_BOTTOM_XML}</w:pPr>'
+        f'<w:r>{_rpr("Arial", 12, bold=True, color="000000")}{_text_xml(text)}</w:r></w:p>',
+    )
 
 
 def _add_cv_section_heading(doc: Document, text: str):
     """Add a CV section heading with horizontal line separator"""
-    heading = doc.add_paragraph()
-    heading.paragraph_format.space_before = Pt(6)
-    heading.paragraph_format.space_after = Pt(4)
-    heading_run = heading.add_run(text)
-    heading_run.font.bold = True
-    heading_run.font.size = Pt(11)
-    heading_run.font.name = 'Arial'
-    heading_run.font.color.rgb = RGBColor(0, 0, 0)
-
-    # Add bottom border (horizontal line)
-    from docx.oxml.shared import OxmlElement
-    from docx.oxml.ns import qn
-
-    pPr = heading._element.get_or_add_pPr()
-    pBdr = OxmlElement('w:pBdr')
-    bottom = OxmlElement('w:bottom')
-    bottom.set(qn('w:val'), 'single')
-    bottom.set(qn('w:sz'), '4')  # Thinner border
-    bottom.set(qn('w:space'), '1')
-    bottom.set(qn('w:color'), '000000')
-    pBdr.append(bottom)
-    pPr.append(pBdr)
-
-
-def _set_body_font(paragraph):
-    """Set consistent body text formatting"""
-    for run in paragraph.runs:
-        run.font.name = 'Arial'
-        run.font.size = Pt(10)
+    _append_paragraphs(
+        doc,
+        f'<w:p><w:pPr>{_BORDER_BOTTOM_THIN_XML}<w:spacing w:before="120" w:after="80"/></w:pPr>'
+        f'<w:r>{_rpr("Arial", 11, bold=True, color="000000")}{_text_xml(text)}</w:r></w:p>',
+    )
+
+
+# Consistent body text formatting
+_BODY_RPR = _rpr('Arial', 10)
+
+
+_HORIZONTAL_LINE = parse_xml(
+    f'<w:p {nsdecls("w")}><w:pPr>{_BORDER_BOTTOM_XML}<w:spacing w:after="0"/></w:pPr></w:p>'
+)
 
 
 def _add_horizontal_line(doc: Document):
-    """Add a horizontal line separator"""
-    from docx.oxml.shared import OxmlElement
-    from docx.oxml.ns import qn
+    """Add a horizontal line separator, copied from the prebuilt bordered paragraph"""
+    doc.element.body._insert_p(deepcopy(_HORIZONTAL_LINE))
+
+
+# Paragraph properties for Template 1's content cells, in twips as the
+# paragraph_format setters wrote them: tab stops for dated/located lines (right
+# edge at 6.2") and the two-column skills lines (second column at 3.75"), zero
+# spacing (with no space before a section's first item), and the bullet indent
+# (0.2" left, 0.15" hanging).
+_TABS_RIGHT_EDGE_XML = '<w:tabs><w:tab w:pos="8928" w:val="right"/></w:tabs>'
+_TABS_SKILL_COLUMN_XML = '<w:tabs><w:tab w:pos="5400" w:val="left"/></w:tabs>'
+_SPACING_FIRST_XML = '<w:spacing w:before="0" w:after="0"/>'
+_SPACING_TIGHT_XML = '<w:spacing w:after="0"/>'
+_IND_BULLET_XML = '<w:ind w:left="288" w:hanging="216"/>'
+
+
+# Template 1's layout table: borderless, zero cell margins, labels column 1.2"
+# (1728 twips) and content column 6.3" (9072 twips), cells aligned to the top.
+# Built from one XML string rather than add_table() plus per-cell property
+# setters, each of which walks the cell's XML again.
+_LAYOUT_TBL_OPEN = (
+    f'<w:tbl {nsdecls("w")}>'
+    '<w:tblPr>'
+    '<w:tblStyle w:val="TableGrid"/>'
+    '<w:tblW w:type="auto" w:w="0"/>'
+    '<w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0" w:lastRow="0"'
+    ' w:noHBand="0" w:noVBand="1" w:val="04A0"/>'
+    '<w:tblBorders>'
+    + ''.join(
+        f'<w:{side} w:val="none" w:sz="0" w:space="0" w:color="auto"/>'
+        for side in ('top', 'left', 'bottom', 'right', 'insideH', 'insideV')
+    )
+    + '</w:tblBorders>'
+    '<w:tblCellMar>'
+    + ''.join(f'<w:{side} w:w="0" w:type="dxa"/>' for side in ('top', 'left', 'bottom', 'right'))
+    + '</w:tblCellMar>'
+    '</w:tblPr>'
+    '<w:tblGrid><w:gridCol w:w="5400"/><w:gridCol w:w="5400"/></w:tblGrid>'
+)
+# Layout rows: the label cell holds the section label in 14pt bold with zero
+# spacing (no PDF conversion gaps), the content cell starts empty for the
+# section to fill. Every row carries the thin bottom border that separates
+# sections.
+_ROW_BORDER = '<w:tcBorders><w:bottom w:val="single" w:sz="4" w:color="000000"/></w:tcBorders>'
+_LAYOUT_TBL_ROW_OPEN = (
+    f'<w:tr {nsdecls("w")}>'
+    f'<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="1728"/><w:vAlign w:val="top"/>{_ROW_BORDER}</w:tcPr>'
+    f'<w:p><w:pPr>{_SPACING_FIRST_XML}</w:pPr><w:r>{_rpr("Calibri", 14, bold=True)}'
+)
+_LAYOUT_TBL_ROW_CLOSE = (
+    '</w:r></w:p></w:tc>'
+    f'<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="9072"/><w:vAlign w:val="top"/>{_ROW_BORDER}</w:tcPr></w:tc>'
+    '</w:tr>'
+)
+
+
+def _add_layout_table(doc: Document) -> Table:
+    """Append Template 1's two-column layout table, without rows."""
+    tbl = parse_xml(_LAYOUT_TBL_OPEN + '</w:tbl>')
+    doc.element.body._insert_tbl(tbl)
+    return Table(tbl, doc._body)
+
+
+def _add_layout_row(table: Table, label: str) -> _Cell:
+    """
+    Append a row labelled `label`, bottom border included, to the layout table
+    and return its content cell. The cell starts with no paragraph; the caller
+    must add at least one.
+    """
+    tr = parse_xml(_LAYOUT_TBL_ROW_OPEN + _text_xml(label) + _LAYOUT_TBL_ROW_CLOSE)
+    table._tbl.append(tr)
+    return _Cell(tr.tc_lst[1], table)
+
+
+def _extend_cell(cell, xml: str) -> None:
+    """Append the paragraphs in `xml` to `cell`, parsed in one call."""
+    cell._tc.extend(list(parse_xml(f'<w:body {_W_NSDECLS}>{xml}</w:body>')))
+
+
+def _append_paragraphs(doc: Document, xml: str) -> None:
+    """Add the paragraphs in `xml` at the end of the document, parsed in one call."""
+    body = doc.element.body
+    end = len(body) - 1  # before the closing sectPr
+    body[end:end] = list(parse_xml(f'<w:body {_W_NSDECLS}>{xml}</w:body>'))
+
+
+def _tabbed_line_xml(spacing: str, left, right, rpr: str) -> str:
+    """Paragraph with `left`, then `right` at the right edge when given."""
+    runs = f'<w:r>{rpr}{_text_xml(left)}</w:r>'
+    if right:
+        spacing = _TABS_RIGHT_EDGE_XML + spacing
+        runs += f'<w:r><w:tab/></w:r><w:r>{rpr}{_text_xml(right)}</w:r>'
+    return f'<w:p><w:pPr>{spacing}</w:pPr>{runs}</w:p>'
+
+
+def _build_experience_xml(exp: dict, first: bool = False) -> str:
+    """
+    Template 1 paragraph markup for one experience entry: company and dates,
+    role and location, then one paragraph per bullet. Same XML the
+    add_paragraph()/paragraph_format calls wrote, so a whole entry is parsed
+    in one call.
+    """
+    bold = _rpr('Calibri', 12, bold=True)
+    body = _rpr('Calibri', 12)
+
+    # Company name and dates on same line, dates bold and right aligned
+    date_str = ''
+    if exp.get('start'):
+        date_str = exp['start']
+        if exp.get('end'):
+            date_str += f" - {exp['end']}"
+    xml = _tabbed_line_xml(
+        _SPACING_FIRST_XML if first else _SPACING_TIGHT_XML,
+        exp.get('company', 'Company Name'), date_str, bold,
+    )
+
+    # Job title and location on same line, location aligned with date
+    xml += _tabbed_line_xml(
+        _SPACING_TIGHT_XML,
+        exp.get('title', exp.get('role', 'Job Title')), exp.get('city', exp.get('location', '')), body,
+    )
+
+    # Bullets with a hanging indent so wrapped lines align with the text
+    for bullet in exp.get('bullets', []):
+        xml += (
+            f'<w:p><w:pPr>{_SPACING_TIGHT_XML}{_IND_BULLET_XML}</w:pPr>'
+            f'<w:r>{body}{_text_xml(f"• {bullet}")}</w:r></w:p>'
+        )
+    return xml
+
+
+def _build_education_xml(edu: dict, first: bool = False) -> str:
+    """Template 1 markup for one education entry: institution and years, then degree and type."""
+    return _tabbed_line_xml(
+        _SPACING_FIRST_XML if first else _SPACING_TIGHT_XML,
+        edu.get('institution', 'Institution Name'), edu.get('years', ''), _rpr('Calibri', 12, bold=True),
+    ) + _tabbed_line_xml(
+        _SPACING_TIGHT_XML, edu.get('degree', ''), edu.get('degree_type', ''), _rpr('Calibri', 12),
+    )
+
+
+def _build_project_xml(proj: dict, first: bool = False) -> str:
+    """Template 1 markup for one project: a bullet paragraph, left empty without details."""
+    details = proj.get('details', '')
+    run = f'<w:r>{_rpr("Calibri", 12)}{_text_xml(f"• {details}")}</w:r>' if details else ''
+    spacing = _SPACING_FIRST_XML if first else _SPACING_TIGHT_XML
+    return f'<w:p><w:pPr>{spacing}{_IND_BULLET_XML}</w:pPr>{run}</w:p>'
+
+
+def _build_reference_xml(ref: dict, first: bool = False) -> str:
+    """Template 1 markup for one reference: bold name, then title and organization if given."""
+    spacing = _SPACING_FIRST_XML if first else _SPACING_TIGHT_XML
+    xml = (
+        f'<w:p><w:pPr>{spacing}</w:pPr>'
+        f'<w:r>{_rpr("Calibri", 12, bold=True)}{_text_xml(ref.get("name", "Reference Name"))}</w:r></w:p>'
+    )
+    for text in (ref.get('title', ''), ref.get('organization', '')):
+        if text:
+            xml += f'<w:p><w:pPr>{_SPACING_TIGHT_XML}</w:pPr><w:r>{_rpr("Calibri", 12)}{_text_xml(text)}</w:r></w:p>'
+    return xml
+
+
+def _build_skill_line_xml(skill1, skill2, first: bool = False) -> str:
+    """Template 1 markup for one two-column skills line; `skill2` may be None."""
+    bold = _rpr('Calibri', 12, bold=True)
+    spacing = _SPACING_FIRST_XML if first else _SPACING_TIGHT_XML
+    runs = f'<w:r>{bold}{_text_xml(skill1)}</w:r><w:r><w:tab/></w:r>'
+    if skill2 is not None:
+        runs += f'<w:r>{bold}{_text_xml(skill2)}</w:r>'
+    return f'<w:p><w:pPr>{_TABS_SKILL_COLUMN_XML}{spacing}</w:pPr>{runs}</w:p>'
+
+
+def _fill_profiles_cell(cell, profiles: list) -> None:
+    """Template 1 profiles: clickable hyperlinks separated by pipes (NO icons)."""
+    content_para = cell.add_paragraph()
+    content_para.paragraph_format.space_before = Pt(0)
+    content_para.paragraph_format.space_after = Pt(0)  # Zero spacing - LibreOffice treats this as row spacing
     
-    para = doc.add_paragraph()
-    pPr = para._element.get_or_add_pPr()
-    pBdr = OxmlElement('w:pBdr')
-    bottom = OxmlElement('w:bottom')
-    bottom.set(qn('w:val'), 'single')
-    bottom.set(qn('w:sz'), '6')
-    bottom.set(qn('w:space'), '1')
-    bottom.set(qn('w:color'), '000000')
-    pBdr.append(bottom)
-    pPr.append(pBdr)
-    para.paragraph_format.space_after = Pt(0)
-
-
-def _add_table_row_border(row):
-    """Add bottom border to a table row"""
-    from docx.oxml.shared import OxmlElement
-    from docx.oxml.ns import qn
+    for idx, profile in enumerate(profiles):
+        platform = profile.get('platform', 'Profile')
+        url = profile.get('url', '')
+        if platform and url:
+            if idx > 0:
+                content_para.add_run(' | ')  # Separator
+            
+            # Add hyperlink
+            _add_hyperlink(content_para, url, platform, font='Calibri', size=12)
     
-    for cell in row.cells:
-        tcPr = cell._element.get_or_add_tcPr()
-        tcBorders = OxmlElement('w:tcBorders')
-        bottom = OxmlElement('w:bottom')
-        bottom.set(qn('w:val'), 'single')
-        bottom.set(qn('w:sz'), '4')
-        bottom.set(qn('w:color'), '000000')
-        tcBorders.append(bottom)
-        tcPr.append(tcBorders)
+    content_para.paragraph_format.space_after = Pt(16)  # Spacing between sections
+
+
+def _fill_summary_cell(cell, summary: str) -> None:
+    """Template 1 summary: one justified body paragraph."""
+    content_para = cell.add_paragraph()
+    content_para.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
+    content_para.paragraph_format.space_before = Pt(0)
+    content_para.paragraph_format.space_after = Pt(16)  # Spacing between sections
+    _add_run(content_para, summary, _rpr('Calibri', 12))  # Body size
+
+
+def _fill_items_cell(cell, items: list, build, separator: str = '') -> None:
+    """Fill `cell` with the markup `build` returns for each item, parsed in one call."""
+    _extend_cell(cell, separator.join(build(item, first=idx == 0) for idx, item in enumerate(items)))
+    cell.paragraphs[-1].paragraph_format.space_after = Pt(16)  # Spacing between sections
+
+
+def _fill_experience_cell(cell, experiences: list) -> None:
+    """Template 1 experience: entries separated by an empty paragraph."""
+    _fill_items_cell(cell, experiences, _build_experience_xml, separator='<w:p/>')
+
+
+def _fill_education_cell(cell, education: list) -> None:
+    """Template 1 education: institution and years, then course and degree type."""
+    _fill_items_cell(cell, education, _build_education_xml)
+
+
+def _fill_projects_cell(cell, projects: list) -> None:
+    """Template 1 projects: one bullet per project."""
+    _fill_items_cell(cell, projects, _build_project_xml)
+
+
+def _fill_references_cell(cell, references: list) -> None:
+    """Template 1 references: name, title and organization lines."""
+    _fill_items_cell(cell, references, _build_reference_xml)
+
+
+def _fill_skills_cell(cell, skills: list) -> None:
+    """Template 1 skills: split into 2 equal bold columns, the second at a tab stop."""
+    skills_per_col = (len(skills) + 1) // 2  # Round up
+    col1 = skills[:skills_per_col]
+    col2 = skills[skills_per_col:]
+    _extend_cell(cell, ''.join(
+        _build_skill_line_xml(skill1, skill2, first=i == 0)
+        for i, (skill1, skill2) in enumerate(zip_longest(col1, col2))
+    ))
+
+
+def _build_t2_experience_xml(exp: dict) -> str:
+    """
+    Template 2 paragraph markup for one experience entry: bold company with
+    dates, italic title with location, then the bullets.
+    """
+    # Company (bold) and dates
+    company = f'<w:r>{_rpr("Calibri", 12, bold=True)}{_text_xml(exp.get("company", "Company"))}</w:r>'
+    dates = f"{exp.get('start', '')} - {exp.get('end', '')}"
+    if dates.strip() != ' - ':
+        company += f'<w:r>{_text_xml(f"  |  {dates}")}</w:r>'
+    xml = f'<w:p><w:pPr><w:spacing w:after="40"/></w:pPr>{company}</w:p>'
+
+    # Title and location
+    title = f'<w:r>{_rpr("Calibri", 11, italic=True)}{_text_xml(exp.get("title", exp.get("role", "Position")))}</w:r>'
+    location = exp.get('city', exp.get('location', ''))
+    if location:
+        title += f'<w:r>{_text_xml(f" – {location}")}</w:r>'
+    xml += f'<w:p><w:pPr><w:spacing w:after="80"/></w:pPr>{title}</w:p>'
+
+    # Bullets
+    body = _rpr('Calibri', 11)
+    for bullet in exp.get('bullets', []):
+        xml += (
+            f'<w:p><w:pPr><w:spacing w:after="40"/>{_IND_BULLET_XML}</w:pPr>'
+            f'<w:r>{body}{_text_xml(f"• {bullet}")}</w:r></w:p>'
+        )
+    return xml
+
+
+def _build_t3_experience_xml(exp: dict, first: bool = False) -> str:
+    """
+    Template 3 paragraph markup for one experience entry: company in caps,
+    bold title with dates, italic gray location, then the bullets.
+    """
+    # Company (bold, ALL CAPS, larger), 8pt above all but the first
+    spacing = '<w:spacing w:before="0" w:after="60"/>' if first else '<w:spacing w:before="160" w:after="60"/>'
+    xml = (
+        f'<w:p><w:pPr>{spacing}</w:pPr>'
+        f'<w:r>{_rpr("Arial", 12, bold=True)}{_text_xml(exp.get("company", "Company").upper())}</w:r></w:p>'
+    )
+
+    # Title and dates
+    title = f'<w:r>{_rpr("Arial", 11, bold=True)}{_text_xml(exp.get("title", exp.get("role", "Position")))}</w:r>'
+    dates = f"{exp.get('start', '')} - {exp.get('end', '')}"
+    if dates.strip() != ' - ':
+        title += f'<w:r>{_text_xml(f"  |  {dates}")}</w:r>'
+    xml += f'<w:p><w:pPr><w:spacing w:after="40"/></w:pPr>{title}</w:p>'
+
+    # Location
+    location = exp.get('city', exp.get('location', ''))
+    if location:
+        xml += (
+            '<w:p><w:pPr><w:spacing w:after="100"/></w:pPr>'
+            f'<w:r>{_rpr("Arial", 10, italic=True, color="505050")}{_text_xml(location)}</w:r></w:p>'
+        )
+
+    # Bullets, 0.25" left with a 0.2" hanging indent
+    body = _rpr('Arial', 11)
+    for bullet in exp.get('bullets', []):
+        xml += (
+            '<w:p><w:pPr><w:spacing w:after="80"/><w:ind w:left="360" w:hanging="288"/></w:pPr>'
+            f'<w:r>{body}{_text_xml(f"▪ {bullet}")}</w:r></w:p>'
+        )
+    return xml
@@ -1,6 +1,7 @@
 """
 Tests for PDF generation using ReportLab
 """
+import os
 import pytest
 from pathlib import Path
 from app.services import pdf_renderer
@@ -140,6 +141,171 @@ class TestPDFGeneration:
         pdf = pdf_renderer.render_pdf_from_data(SAMPLE_DATA, 'template_invalid')
         assert pdf[:4] == b'%PDF'
     
+    def test_render_is_deterministic(self):
+        """Identical answers produce byte-identical PDFs"""
+        for render in (pdf_renderer.render_template_1_pdf, pdf_renderer.render_template_2_pdf,
+                       pdf_renderer.render_template_3_pdf):
+            assert render(SAMPLE_DATA) == render(SAMPLE_DATA)
+    
+    def test_render_pdf_from_data_caches_identical_answers(self):
+        """Identical answers are served from cache; changed answers re-render"""
+        pdf_renderer.clear_pdf_cache()
+        data = {"basics": {"name": "Cache Test"}, "summary": "First"}
+        
+        first = pdf_renderer.render_pdf_from_data(data, 'template_1')
+        assert pdf_renderer.render_pdf_from_data(dict(data), 'template_1') is first
+        assert pdf_renderer.render_pdf_from_data(data, 'template_2') is not first
+        
+        data["summary"] = "Second"
+        assert pdf_renderer.render_pdf_from_data(data, 'template_1') is not first
+    
+    def test_template_styles_are_not_rebuilt_per_render(self, monkeypatch):
+        """Every PDF renderer reuses module-level ParagraphStyles"""
+        def fail(*args, **kwargs):
+            raise AssertionError("ParagraphStyle built during render")
+        monkeypatch.setattr(pdf_renderer, 'ParagraphStyle', fail)
+        
+        for template in ('template_1', 'template_2', 'template_3'):
+            pdf_renderer._RENDERERS[template](SAMPLE_DATA)
+        pdf_renderer.render_cover_letter_pdf({"basics": {"name": "Cover"}, "cover_role": "Dev", "cover_company": "Acme"})
+        pdf_renderer.render_revamp_pdf({"revamped_content": "Line one\n\nLine two"})
+    
+    def test_template_1_long_resume_spans_pages(self):
+        """Sections flow onto further pages"""
+        data = dict(SAMPLE_DATA)
+        data['summary'] = SAMPLE_DATA['summary'] * 10
+        data['experiences'] = SAMPLE_DATA['experiences'] * 3
+        data['education'] = SAMPLE_DATA['education'] * 6
+        
+        pdf_bytes = pdf_renderer.render_template_1_pdf(data)
+        
+        assert pdf_bytes.count(b'/Type /Page\n') > 1
+    
+    def test_contact_line(self):
+        """Contact line prefers location, falls back to city/country, skips blanks"""
+        assert pdf_renderer._contact_line({"location": "Lagos", "phone": "1", "email": "a@b.co"}) == "Lagos | 1 | a@b.co"
+        assert pdf_renderer._contact_line({"city": "Abuja", "country": "Nigeria", "email": "a@b.co"}) == "Abuja, Nigeria | a@b.co"
+        assert pdf_renderer._contact_line({}) == ""
+    
+    def test_fixed_para_reuses_parsed_markup(self):
+        """Fixed headings are parsed once and copied per use"""
+        first = pdf_renderer._fixed_para('<b>PROJECTS</b>', pdf_renderer._T2_HEADING_STYLE)
+        second = pdf_renderer._fixed_para('<b>PROJECTS</b>', pdf_renderer._T2_HEADING_STYLE)
+        
+        assert first is not second
+        assert first.frags is second.frags
+    
+    def test_clean_skills(self):
+        """Skills are stripped once, junk dropped, and the limit applied"""
+        skills = [" Python ", "1", "2024", "", None, 5, "Go", "SQL", "Rust"]
+        
+        assert pdf_renderer._clean_skills(skills) == ["Python", "Go", "SQL", "Rust"]
+        assert pdf_renderer._clean_skills(skills, limit=2) == ["Python", "Go"]
+    
+    def test_sanitize_maps_naira_and_skips_clean_text(self):
+        """Naira glyphs become 'N'; text without them is returned as-is"""
+        assert pdf_renderer._sanitize("Saved ₦5M ■") == "Saved N5M N"
+        clean = "Saved $5M"
+        assert pdf_renderer._sanitize(clean) is clean
+        assert pdf_renderer._bullet_text("R&D ₦5M") == "• R&amp;D N5M"
+    
+    def test_projects_without_details_are_skipped(self):
+        """No Projects heading is drawn when every project lacks details"""
+        assert pdf_renderer._t1_projects_row([{"details": ""}, {}]) is None
+        
+        base = {"basics": {"name": "Jane Doe"}}
+        empty_projects = {**base, "projects": [{"details": ""}, {"name": "Side"}]}
+        for render in (pdf_renderer.render_template_1_pdf,
+                       pdf_renderer.render_template_2_pdf,
+                       pdf_renderer.render_template_3_pdf):
+            assert render(empty_projects) == render(base)
+    
+    def test_templates_escape_markup_in_user_text(self):
+        """Ampersands and angle brackets in user data are escaped, not parsed"""
+        assert pdf_renderer._esc("R&D <lead>") == "R&amp;D &lt;lead&gt;"
+        assert pdf_renderer._esc(None) == ""
+        data = {
+            "basics": {"name": "Tom <Dev>"},
+            "summary": "R&D lead, 5 < 10",
+            "experiences": [{"company": "AT&T", "title": "Eng", "bullets": ["Cut <b>cost</b> & time"]}],
+            "skills": ["C&C++"],
+        }
+        
+        for render in (pdf_renderer.render_template_1_pdf, pdf_renderer.render_template_2_pdf,
+                       pdf_renderer.render_template_3_pdf):
+            assert render(data).startswith(b'%PDF')
+    
+    def test_register_template_dispatch(self):
+        """Registered templates are dispatched by name"""
+        pdf_renderer.register_template('template_test')(lambda answers: b'%PDF-test')
+        try:
+            pdf_bytes = pdf_renderer.render_pdf_from_data({"basics": {"name": "Plugin"}}, 'template_test')
+            assert pdf_bytes == b'%PDF-test'
+        finally:
+            pdf_renderer._RENDERERS.pop('template_test', None)
+            pdf_renderer.clear_pdf_cache()
+    
+    def test_render_pdf_from_data_async(self):
+        """Async wrapper returns the same PDF as an uncached in-process render"""
+        import asyncio
+        data = {"basics": {"name": "Async Test"}}
+        pdf_renderer.clear_pdf_cache()
+        try:
+            pdf_bytes = asyncio.run(pdf_renderer.render_pdf_from_data_async(data, 'template_1'))
+        finally:
+            pdf_renderer.shutdown_pdf_pool()
+        
+        assert pdf_bytes.startswith(b'%PDF')
+        assert pdf_bytes == pdf_renderer._render_pdf(data, 'template_1', 'resume')
+        assert pdf_renderer.render_pdf_from_data(data, 'template_1') is pdf_bytes
+        pdf_renderer.clear_pdf_cache()
+    
+    def test_render_pdf_from_data_async_recovers_from_dead_worker(self):
+        """A killed pool worker does not break later async renders"""
+        import asyncio
+        import signal
+        render = pdf_renderer.render_pdf_from_data_async
+        try:
+            asyncio.run(render({"basics": {"name": "Before"}}, 'template_1'))
+            broken_pool = pdf_renderer._pdf_pool
+            for process in list(broken_pool._processes.values()):
+                os.kill(process.pid, signal.SIGKILL)
+                process.join()
+
+            assert asyncio.run(render({"basics": {"name": "During"}}, 'template_1')).startswith(b'%PDF')
+            assert asyncio.run(render({"basics": {"name": "After"}}, 'template_1')).startswith(b'%PDF')
+            assert pdf_renderer._pdf_pool is not broken_pool
+        finally:
+            pdf_renderer.shutdown_pdf_pool()
+            pdf_renderer.clear_pdf_cache()
+
+    def test_render_pdfs_from_data_batch(self):
+        """Batch rendering returns one PDF per input, in order, through the cache"""
+        minimal = {"basics": {"name": "Jane Smith"}}
+        pdf_renderer.clear_pdf_cache()
+        try:
+            pdfs = pdf_renderer.render_pdfs_from_data([SAMPLE_DATA, minimal, SAMPLE_DATA], 'template_2')
+
+            assert len(pdfs) == 3
+            assert all(pdf[:4] == b'%PDF' for pdf in pdfs)
+            assert len(pdfs[1]) < len(pdfs[0])
+            assert pdf_renderer.render_pdf_from_data(minimal, 'template_2') is pdfs[1]
+        finally:
+            pdf_renderer.shutdown_pdf_pool()
+            pdf_renderer.clear_pdf_cache()
+    
+    def test_render_all_templates(self):
+        """Every registered template is rendered and keyed by name"""
+        try:
+            pdfs = pdf_renderer.render_all_templates(SAMPLE_DATA)
+
+            assert set(pdfs) == {'template_1', 'template_2', 'template_3'}
+            assert all(pdf.startswith(b'%PDF') for pdf in pdfs.values())
+            assert pdf_renderer.render_pdf_from_data(SAMPLE_DATA, 'template_3') is pdfs['template_3']
+        finally:
+            pdf_renderer.shutdown_pdf_pool()
+            pdf_renderer.clear_pdf_cache()
+    
     def test_minimal_data_generates_pdf(self):
         """Test PDF generation with minimal data"""
         minimal_data = {
@@ -5,6 +5,10 @@ Tests DOCX generation for resumes, CVs, and cover letters
 import pytest
 from io import BytesIO
 from docx import Document
+from docx.enum.text import WD_TAB_ALIGNMENT
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls, qn
+from docx.shared import Inches, Pt, RGBColor
 from app.services import renderer
 from app.models import Job
 
@@ -235,6 +239,20 @@ class TestRenderCoverLetter:
         # Should contain closing
         assert "Sincerely" in text or "Regards" in text
 
+    def test_cover_letter_skills_and_contact_line(self, sample_cover_letter_data):
+        """Test key skills are Oxford-comma joined and the contact line repeats in the signature"""
+        def render(key_skills):
+            job = Job(type="cover", answers={**sample_cover_letter_data, "cover_key_skills": key_skills})
+            return [p.text for p in Document(BytesIO(renderer.render_cover_letter(job))).paragraphs]
+
+        text = "\n".join(render(["Strategy", "Analytics", "Delivery"]))
+        assert "execution: Strategy, Analytics, and Delivery." in text
+        assert "execution: Strategy, and Analytics." in "\n".join(render(["Strategy", "Analytics"]))
+        assert "execution: Strategy." in "\n".join(render(["Strategy"]))
+
+        contact_line = "+1234567890 | alex@example.com"
+        assert render([]).count(contact_line) == 2
+
 
 class TestRenderingEdgeCases:
     """Test edge cases in rendering"""
@@ -444,3 +462,180 @@ class TestDocumentStructure:
         
         # File should be between 10KB and 500KB
         assert 10_000 < len(doc_bytes) < 500_000
+
+    def test_new_document_is_independent_copy(self):
+        """Documents cloned from the cached skeleton don't share content"""
+        first = renderer._new_document(0.75)
+        first.add_paragraph("Only in the first document")
+        second = renderer._new_document(0.75)
+        
+        assert all(p.text == "" for p in second.paragraphs)
+        for section in second.sections:
+            assert section.left_margin == Inches(0.75)
+            assert section.top_margin == Inches(0.75)
+
+    def test_layout_table_is_borderless_two_column(self):
+        """Template 1's layout table has fixed column widths and no borders"""
+        doc = renderer._new_document(0.5)
+        table = renderer._add_layout_table(doc)
+        assert len(table.rows) == 0
+        cells = [renderer._add_layout_row(table, label) for label in ("Summary", "R&D", "Skills")]
+        
+        assert len(table.rows) == 3
+        assert cells[-1]._tc is table._tbl.tr_lst[-1].tc_lst[1]
+        assert table.style.name == "Table Grid"
+        for row, label in zip(table.rows, ("Summary", "R&D", "Skills")):
+            assert row.cells[0].width == Inches(1.2)
+            assert row.cells[1].width == Inches(6.3)
+            assert row.cells[0].text == label
+            assert row.cells[1].paragraphs == []  # filled by the section
+            for cell in row.cells:  # section separator on every row
+                assert cell._tc.tcPr.find(qn('w:tcBorders')) is not None
+        assert 'w:val="none"' in table._element.tblPr.xml
+        assert doc.element.body[-1].tag.endswith("sectPr")
+
+    def test_hyperlink_text_round_trips(self):
+        """Hyperlink runs keep spaces, markup characters and tabs intact"""
+        doc = renderer._new_document(0.5)
+        para = doc.add_paragraph()
+        for text in (" GitHub ", "R&D <Lab>", "Port\tfolio"):
+            run = renderer._add_hyperlink(para, "https://example.com/?a=1&b=2", text)
+            assert run.text == text
+        
+        hyperlink = para._p[0]
+        assert hyperlink.tag.endswith("hyperlink")
+        assert 'xml:space="preserve"' in hyperlink.xml
+        assert "0000FF" in hyperlink.xml
+        
+        styled = renderer._add_hyperlink(para, "https://example.com", "Site", font='Calibri', size=12)
+        assert styled.font.name == 'Calibri'
+        assert styled.font.size == Pt(12)
+        assert styled.font.underline is True
+
+    def test_template_1_tab_stops(self, db_session, test_user):
+        """Dates sit on a right tab at 6.2" and skills use a 3.75" column"""
+        job = Job(
+            user_id=test_user.id,
+            type="resume",
+            answers={
+                "basics": {"name": "Jane Doe"},
+                "experiences": [{"company": "Acme", "title": "Lead", "start": "2020", "end": "2024"}],
+                "skills": ["Python", "SQL", "Go"],
+            }
+        )
+        
+        doc = Document(BytesIO(renderer.render_resume(job)))
+        exp_cell, skills_cell = (row.cells[1] for row in doc.tables[0].rows)
+        
+        date_tab = exp_cell.paragraphs[0].paragraph_format.tab_stops[0]
+        assert date_tab.position == Inches(6.2)
+        assert date_tab.alignment == WD_TAB_ALIGNMENT.RIGHT
+        skill_tab = skills_cell.paragraphs[0].paragraph_format.tab_stops[0]
+        assert skill_tab.position == Inches(3.75)
+        assert skill_tab.alignment == WD_TAB_ALIGNMENT.LEFT
+
+    def test_clean_skills(self):
+        """Skills are stripped once and numbers, blanks and one-letter junk dropped"""
+        skills = [" Python ", "12", "  ", "", None, 7, "C", " Go", "SQL"]
+        
+        assert renderer._clean_skills(skills) == ["Python", "Go", "SQL"]
+        assert renderer._clean_skills(None) == []
+
+    def test_render_resumes_from_data_batch(self, sample_resume_data):
+        """Batch rendering returns one DOCX per input, in order, using each template"""
+        answers_list = [
+            {**sample_resume_data, "template": "template_2"},
+            {"basics": {"name": "Jane Smith"}},
+            {**sample_resume_data, "template": "template_3"},
+        ]
+        try:
+            docs = renderer.render_resumes_from_data(answers_list)
+            assert renderer._docx_pool is not None  # rendered by workers, not the inline fallback
+        finally:
+            renderer.shutdown_docx_pool()
+        
+        assert len(docs) == 3
+        texts = [_docx_full_text(Document(BytesIO(d))) for d in docs]
+        assert "JOHN DOE" in texts[0]
+        assert "JANE SMITH" in texts[1].upper()
+        assert "PROFESSIONAL EXPERIENCE" in texts[2]
+
+    def test_render_resumes_from_data_recovers_from_dead_worker(self, sample_resume_data):
+        """A killed pool worker does not break the batch or later batches"""
+        import os
+        import signal
+        answers_list = [sample_resume_data, {"basics": {"name": "Jane Smith"}}]
+        try:
+            renderer.render_resumes_from_data(answers_list)
+            broken_pool = renderer._docx_pool
+            for process in list(broken_pool._processes.values()):
+                os.kill(process.pid, signal.SIGKILL)
+                process.join()
+
+            assert len(renderer.render_resumes_from_data(answers_list)) == 2
+            assert len(renderer.render_resumes_from_data(answers_list)) == 2
+            assert renderer._docx_pool is not broken_pool
+        finally:
+            renderer.shutdown_docx_pool()
+
+    def test_add_run_matches_python_docx_formatting(self):
+        """Prebuilt run formatting produces the same XML as the font setters"""
+        doc = renderer._new_document(0.5)
+        for text in (" R&D <lead> ", "Lead\tengineer", "Line one\r\n line two "):
+            expected = doc.add_paragraph()
+            run = expected.add_run(text)
+            run.font.bold = True
+            run.font.italic = True
+            run.font.size = Pt(13)
+            run.font.name = 'Calibri'
+            run.font.color.rgb = RGBColor(0, 51, 102)
+            
+            actual = doc.add_paragraph()
+            renderer._add_run(actual, text, renderer._rpr('Calibri', 13, bold=True, italic=True, color='003366'))
+            
+            assert actual._p.xml == expected._p.xml
+        assert renderer._add_text_paragraph(doc, "", renderer._rpr('Arial', 10)).runs == []
+
+    def test_build_experience_xml_paragraphs(self):
+        """An experience entry builds header, role and one paragraph per bullet"""
+        xml = renderer._build_experience_xml({
+            'company': 'Acme & Co', 'start': '2020', 'end': '2023',
+            'title': 'Engineer', 'city': 'Lagos', 'bullets': ['Shipped <v2>', 'Led team'],
+        }, first=True)
+        body = parse_xml(f'<w:body {nsdecls("w")}>{xml}</w:body>')
+        texts = [''.join(t.text for t in p.iter(qn('w:t'))) for p in body]
+        
+        assert texts == ['Acme & Co2020 - 2023', 'EngineerLagos', '• Shipped <v2>', '• Led team']
+        assert len(body[0].findall(f'.//{qn("w:tab")}')) == 2  # tab stop + tab run
+
+
+    def test_t2_t3_experience_xml_paragraphs(self):
+        """Templates 2 and 3 build company, title, location and bullet lines per entry"""
+        exp = {'company': 'Acme', 'start': '2020', 'end': '2023', 'title': 'Lead', 'city': 'Abuja', 'bullets': ['Grew <ARR>']}
+        for xml, expected in (
+            (renderer._build_t2_experience_xml(exp), ['Acme  |  2020 - 2023', 'Lead – Abuja', '• Grew <ARR>']),
+            (renderer._build_t3_experience_xml(exp, first=True), ['ACME', 'Lead  |  2020 - 2023', 'Abuja', '▪ Grew <ARR>']),
+        ):
+            body = parse_xml(f'<w:body {nsdecls("w")}>{xml}</w:body>')
+            assert [''.join(t.text for t in p.iter(qn('w:t'))) for p in body] == expected
+
+    def test_letter_date_format(self):
+        """Cover letter date line uses the long month format"""
+        from datetime import date
+        assert renderer._letter_date(date(2026, 1, 5).toordinal()) == "January 05, 2026"
+
+    def test_section_builders_match_layout(self):
+        """Education, project, reference and skill builders keep their line structure"""
+        xml = (
+            renderer._build_education_xml({'institution': 'Uni', 'degree': 'BSc'}, first=True)
+            + renderer._build_project_xml({})
+            + renderer._build_reference_xml({'name': 'Ada', 'organization': 'Org'})
+            + renderer._build_skill_line_xml('Go', None)
+        )
+        body = parse_xml(f'<w:body {nsdecls("w")}>{xml}</w:body>')
+        texts = [''.join(t.text for t in p.iter(qn('w:t'))) for p in body]
+        
+        assert texts == ['Uni', 'BSc', '', 'Ada', 'Org', 'Go']
+        assert body[0].find(f'.//{qn("w:tabs")}') is None  # no years, no tab stop
+        assert body[2].find(f'.//{qn("w:ind")}') is not None
+        assert body[-1].find(f'.//{qn("w:tabs")}') is not None
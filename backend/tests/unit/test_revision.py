@@ -0,0 +1,37 @@
+"""
+Tests for the guided revision flow
+"""
+import pytest
+from unittest.mock import AsyncMock, patch
+from app.flows import revision
+from app.models import Job
+
+
+@pytest.mark.asyncio
+class TestRevisionConfirmation:
+    """Test regenerating a document after a revision is confirmed"""
+
+    @patch("app.flows.revision.storage.save_document", new_callable=AsyncMock)
+    @patch("app.flows.revision.pdf_renderer.render_pdf_from_data_async", new_callable=AsyncMock)
+    async def test_confirm_regenerates_document(self, mock_render, mock_save, db_session, test_user, sample_resume_data):
+        mock_render.return_value = b"%PDF-revised"
+        mock_save.return_value = "https://example.com/revised.pdf"
+        job = Job(
+            user_id=test_user.id,
+            type="resume",
+            status="revising",
+            answers={**sample_resume_data, "_revision_step": "confirm", "_revision_section": "skills"},
+            revision_answers={"skills": ["Rust", "Go"]},
+        )
+        db_session.add(job)
+        db_session.commit()
+
+        response = await revision.handle_revision_step(db_session, job, "yes", test_user.telegram_user_id)
+
+        assert response.startswith(f"__SEND_DOCUMENT__|{job.id}|")
+        assert job.answers["skills"] == ["Rust", "Go"]
+        assert "_revision_step" not in job.answers
+        assert job.revision_count == 1
+        assert job.draft_text == "https://example.com/revised.pdf"
+        mock_render.assert_awaited_once_with(job.answers, "template_1", "resume")
+        assert mock_save.await_args.args[1] == b"%PDF-revised"